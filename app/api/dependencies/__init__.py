@@ -1,3 +1,4 @@
 from .auth import get_current_user, get_optional_user, TokenPayload
+from .rate_limit import RateLimiter
 
-__all__ = ["get_current_user", "get_optional_user", "TokenPayload"]
+__all__ = ["get_current_user", "get_optional_user", "TokenPayload", "RateLimiter"]
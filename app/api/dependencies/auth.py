@@ -1,24 +1,74 @@
 """
 Authentication dependencies for FastAPI routes.
-Uses Supabase to verify JWT tokens.
+Verifies Supabase JWTs locally (HS256 secret or cached JWKS), falling back to Supabase Auth.
 """
 
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
 from typing import Optional
 from app.config.settings import settings
+from app.services.cache import TTLCache
 
 try:
     from supabase import create_client
 except ImportError:
     raise ImportError("Supabase not installed")
 
+try:
+    import jwt
+except ImportError:
+    raise ImportError("PyJWT not installed")
+
+logger = logging.getLogger(__name__)
+
+# Settings read once at import; the auth path runs on every request
+_SUPABASE_URL = settings.supabase_url
+_SUPABASE_KEY = settings.supabase_key
+_SUPABASE_JWT_SECRET = settings.supabase_jwt_secret
+
 security = HTTPBearer(auto_error=False)
 
+# Verified token cache: repeat requests with the same token skip the Supabase roundtrip
+TOKEN_CACHE_MAX_ENTRIES = 10000
+TOKEN_CACHE_TTL_SECONDS = 30
+_token_cache = TTLCache(max_entries=TOKEN_CACHE_MAX_ENTRIES, ttl_seconds=TOKEN_CACHE_TTL_SECONDS)
+
+# Rejected token cache: clients replaying a bad token don't hammer Supabase
+REJECTED_TOKEN_CACHE_MAX_ENTRIES = 1000
+REJECTED_TOKEN_CACHE_TTL_SECONDS = 5
+_rejected_tokens = TTLCache(max_entries=REJECTED_TOKEN_CACHE_MAX_ENTRIES, ttl_seconds=REJECTED_TOKEN_CACHE_TTL_SECONDS)
+
+# 401 details for failed auth. Each failure raises a fresh HTTPException: a shared instance
+# would keep the last request's traceback (and the rejected token in its frames) alive.
+MISSING_TOKEN_DETAIL = "Missing authentication token"
+INVALID_TOKEN_DETAIL = "Invalid or expired token"
 
-class TokenPayload(BaseModel):
-    """JWT token payload schema."""
+
+def _unauthorized(detail: str) -> HTTPException:
+    """Build a 401 with the Bearer challenge header."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+# Local JWT verification
+SUPABASE_JWT_AUDIENCE = "authenticated"
+ASYMMETRIC_JWT_ALGORITHMS = ("RS256", "ES256")
+# Expiry is enforced inside jwt.decode (raises ExpiredSignatureError); no manual clock check needed
+JWT_DECODE_OPTIONS = {"verify_exp": True, "require": ["exp", "sub"]}
+
+
+@dataclass(slots=True, frozen=True)
+class TokenPayload:
+    """Verified JWT token payload. Built only from trusted data, so no validation layer."""
     sub: str  # User ID
     email: Optional[str] = None
     aud: Optional[str] = None
@@ -27,60 +77,156 @@ class TokenPayload(BaseModel):
     role: Optional[str] = None
 
 
+@lru_cache(maxsize=1)
 def get_supabase_client():
-    """Get Supabase client for auth verification."""
-    if not settings.supabase_url or not settings.supabase_key:
+    """Get Supabase client for auth verification (one per process, reuses its HTTP pool)."""
+    if not _SUPABASE_URL or not _SUPABASE_KEY:
         raise ValueError("Supabase not configured")
-    return create_client(settings.supabase_url, settings.supabase_key)
+    return create_client(_SUPABASE_URL, _SUPABASE_KEY)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> TokenPayload:
+@lru_cache(maxsize=1)
+def get_jwks_client() -> "jwt.PyJWKClient":
+    """Get JWKS client for Supabase asymmetric signing keys. The client caches the key set
+    and refetches it for an unknown kid, so rotated or revoked keys are picked up."""
+    if not _SUPABASE_URL:
+        raise ValueError("Supabase not configured")
+    return jwt.PyJWKClient(f"{_SUPABASE_URL}/auth/v1/.well-known/jwks.json")
+
+
+async def _verify_locally(token: str) -> Optional[TokenPayload]:
     """
-    Validate JWT token using Supabase and return current user payload.
+    Verify the JWT signature and claims without a network call.
 
-    Raises 401 if token is missing or invalid.
+    Returns None when no local key applies (no Supabase JWT secret for HS256 tokens,
+    HS256 signature not matching that secret, unknown algorithm, JWKS unreachable or
+    kid not found); the caller then falls back to Supabase Auth.
+    Raises jwt.InvalidTokenError if the token is invalid or expired.
     """
-    if credentials is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing authentication token",
-            headers={"WWW-Authenticate": "Bearer"},
+    header = jwt.get_unverified_header(token)
+    algorithm = header.get("alg")
+
+    if algorithm == "HS256" and _SUPABASE_JWT_SECRET:
+        key = _SUPABASE_JWT_SECRET
+    elif algorithm in ASYMMETRIC_JWT_ALGORITHMS and _SUPABASE_URL:
+        try:
+            # JWKS lookup may fetch the key set (sync HTTP call, keep it off the event loop)
+            signing_key = await asyncio.to_thread(get_jwks_client().get_signing_key_from_jwt, token)
+        except jwt.PyJWKClientError as e:
+            logger.warning("JWKS key lookup failed, falling back to Supabase Auth: %s", e)
+            return None
+        key = signing_key.key
+    else:
+        return None
+
+    try:
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=[algorithm],
+            audience=SUPABASE_JWT_AUDIENCE,
+            options=JWT_DECODE_OPTIONS,
         )
+    except jwt.InvalidSignatureError:
+        if algorithm != "HS256":
+            raise
+        # A wrong SUPABASE_JWT_SECRET would otherwise reject every valid token; let Supabase decide
+        logger.warning("HS256 token does not match SUPABASE_JWT_SECRET, falling back to Supabase Auth")
+        return None
 
-    token = credentials.credentials
+    return TokenPayload(
+        sub=claims["sub"],
+        email=claims.get("email"),
+        aud=SUPABASE_JWT_AUDIENCE,
+        exp=claims.get("exp"),
+        iat=claims.get("iat"),
+        role=claims.get("role"),
+    )
 
-    try:
-        supabase = get_supabase_client()
 
-        # Use Supabase to verify the token and get user
-        user_response = supabase.auth.get_user(token)
+def _token_cache_key(token: str) -> bytes:
+    """Hash the token so raw credentials are never kept in memory."""
+    return hashlib.sha256(token.encode()).digest()[:16]
 
-        if user_response is None or user_response.user is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
 
-        user = user_response.user
+def _cache_token_payload(key: bytes, payload: TokenPayload) -> None:
+    """Cache a verified payload, never beyond the token's own expiry."""
+    ttl = TOKEN_CACHE_TTL_SECONDS
+    if payload.exp is not None:
+        ttl = min(ttl, payload.exp - time.time())
+    _token_cache.set(key, payload, ttl_seconds=ttl)
 
-        return TokenPayload(
-            sub=user.id,
-            email=user.email,
-            aud="authenticated",
-            role=user.role if hasattr(user, 'role') else None
-        )
 
-    except HTTPException:
-        raise
+async def _verify_token(token: str) -> Optional[TokenPayload]:
+    """
+    Verify a bearer token, returning None instead of raising when it is rejected.
+
+    Verifies locally when a signing key is available, otherwise asks Supabase Auth.
+    Definitive rejections are remembered briefly so a client replaying a bad token
+    does not cost a Supabase roundtrip per request.
+    """
+    cache_key = _token_cache_key(token)
+
+    cached = _token_cache.get(cache_key)
+    if cached is not None and (cached.exp is None or cached.exp > time.time()):
+        return cached
+
+    if _rejected_tokens.get(cache_key):
+        return None
+
+    try:
+        payload = await _verify_locally(token)
+
+        if payload is None:
+            supabase = get_supabase_client()
+
+            # Use Supabase to verify the token and get user (sync HTTP call, keep it off the event loop)
+            user_response = await asyncio.to_thread(supabase.auth.get_user, token)
+
+            if user_response is None or user_response.user is None:
+                _rejected_tokens.set(cache_key, True)
+                return None
+
+            user = user_response.user
+            payload = TokenPayload(
+                sub=user.id,
+                email=user.email,
+                aud=SUPABASE_JWT_AUDIENCE,
+                exp=None,
+                iat=None,
+                role=getattr(user, 'role', None)
+            )
+
+    except jwt.InvalidTokenError as e:
+        # Signature, expiry or claim failure: a definitive rejection
+        logger.debug("Token rejected: %s", e)
+        _rejected_tokens.set(cache_key, True)
+        return None
     except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Token verification failed: {str(e)}",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        # Not cached: may be a transient Supabase/JWKS/network failure (e.g. PyJWKClientError)
+        logger.warning("Token verification failed: %s", e)
+        return None
+
+    _cache_token_payload(cache_key, payload)
+    return payload
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> TokenPayload:
+    """
+    Validate JWT token and return current user payload.
+
+    Raises 401 if token is missing or invalid.
+    """
+    if credentials is None:
+        raise _unauthorized(MISSING_TOKEN_DETAIL)
+
+    payload = await _verify_token(credentials.credentials)
+    if payload is None:
+        raise _unauthorized(INVALID_TOKEN_DETAIL)
+
+    return payload
 
 
 async def get_optional_user(
@@ -94,7 +240,4 @@ async def get_optional_user(
     if credentials is None:
         return None
 
-    try:
-        return await get_current_user(credentials)
-    except HTTPException:
-        return None
+    return await _verify_token(credentials.credentials)
@@ -0,0 +1,105 @@
+"""In-process fixed-window rate limiting for expensive auth endpoints.
+Used by: auth routes (signin, signup, refresh-token as dependencies; send-otp keyed by phone)."""
+
+import ipaddress
+import math
+import time
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.config.settings import settings
+from app.services.cache import TTLCache
+
+
+def _parse_trusted_proxies(value: str):
+    """Parse settings.trusted_proxy_ips into networks; None means every peer is trusted ("*")."""
+    entries = [entry.strip() for entry in value.split(",") if entry.strip()]
+    if "*" in entries:
+        return None
+    return tuple(ipaddress.ip_network(entry, strict=False) for entry in entries)
+
+
+_TRUSTED_PROXIES = _parse_trusted_proxies(settings.trusted_proxy_ips)
+
+
+@lru_cache(maxsize=4096)
+def _is_trusted_proxy(host: str) -> bool:
+    """Whether host is a configured reverse proxy."""
+    if _TRUSTED_PROXIES is None:
+        return True
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in _TRUSTED_PROXIES)
+
+
+def client_ip(request: Request) -> str:
+    """Client address for rate limiting. When the direct peer is a trusted proxy, X-Forwarded-For
+    is walked from the right and the first hop that is not itself a trusted proxy is the client;
+    hops left of it are client-supplied and ignored. Untrusted peers' headers are never read."""
+    peer = request.client.host if request.client else "unknown"
+    if not _is_trusted_proxy(peer):
+        return peer
+
+    forwarded = request.headers.get("x-forwarded-for")
+    if not forwarded:
+        return peer
+
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+class RateLimiter:
+    """Allow `limit` hits per `window_seconds` per key. Use as a FastAPI dependency (keyed by
+    client_ip, so set TRUSTED_PROXY_IPS behind a reverse proxy) or call hit() with an explicit key.
+
+    Counters live in a bounded in-process TTLCache and are NOT shared between worker processes:
+    with `uvicorn --workers N` a client can make up to N x `limit` hits per window."""
+
+    def __init__(self, limit: int, window_seconds: int, scope: str, max_keys: int = 10000):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.scope = scope
+        self._windows = TTLCache(max_entries=max_keys, ttl_seconds=window_seconds)
+
+    def hit(self, key: str, response: Optional[Response] = None) -> None:
+        """Count one hit for key; raise 429 with Retry-After once the window is exhausted."""
+        now = time.monotonic()
+        reset_at, count = self._windows.get(key, (now + self.window_seconds, 0))
+        count += 1
+        self._windows.set(key, (reset_at, count), ttl_seconds=reset_at - now)
+
+        remaining = max(self.limit - count, 0)
+        reset_in = max(math.ceil(reset_at - now), 1)
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(reset_in),
+        }
+
+        if count > self.limit:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Too many {self.scope} attempts. Try again in {reset_in} seconds.",
+                headers={**headers, "Retry-After": str(reset_in)},
+            )
+
+        if response is not None:
+            response.headers.update(headers)
+
+    async def __call__(self, request: Request, response: Response) -> None:
+        """Dependency form: limit by client IP."""
+        self.hit(client_ip(request), response)
+
+
+# Auth endpoint limits
+signin_limiter = RateLimiter(limit=5, window_seconds=60, scope="sign in")
+signup_limiter = RateLimiter(limit=10, window_seconds=3600, scope="sign up")
+refresh_limiter = RateLimiter(limit=20, window_seconds=60, scope="token refresh")
+send_otp_limiter = RateLimiter(limit=3, window_seconds=3600, scope="OTP")
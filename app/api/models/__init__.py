@@ -1,3 +1,11 @@
+from app.api.models.enums import (
+    CrawlerType,
+    TriggerMode,
+    SubscriptionStatus,
+    AuthUserRole,
+    AccountStatus,
+)
+
 from app.api.models.auth import (
     SignUpRequest,
     SignInRequest,
@@ -7,14 +15,9 @@ from app.api.models.auth import (
     PhoneSignUpRequest,
     PhoneVerifyRequest,
     OTPResponse,
-    SubscriptionStatus,
-    AuthUserRole,
-    AccountStatus,
     NotificationPreferences,
     UserProfile,
-    SignUpRequestExtended,
     UsernameCheckRequest,
-    UsernameCheckResponse,
     BloomFilterResponse,
     PasswordValidationRequest,
     PasswordValidationResponse,
@@ -23,8 +26,7 @@ from app.api.models.auth import (
 )
 
 from app.api.models.crawler import (
-    CrawlerType,
-    TriggerMode,
+    CrawlerTypeName,
     Citation,
     CitationList,
     CrawledPage,
@@ -52,9 +54,7 @@ __all__ = [
     "AccountStatus",
     "NotificationPreferences",
     "UserProfile",
-    "SignUpRequestExtended",
     "UsernameCheckRequest",
-    "UsernameCheckResponse",
     "BloomFilterResponse",
     "PasswordValidationRequest",
     "PasswordValidationResponse",
@@ -62,6 +62,7 @@ __all__ = [
     "RandomUsernameResponse",
     # Crawler models
     "CrawlerType",
+    "CrawlerTypeName",
     "TriggerMode",
     "Citation",
     "CitationList",
@@ -1,11 +1,21 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints, field_validator
+from typing import Annotated, Optional, List, Dict, Any
+from typing_extensions import TypedDict  # pydantic requires the typing_extensions version on Python < 3.12
 from datetime import datetime
-from enum import Enum
+from app.api.models.enums import SubscriptionStatus, AuthUserRole, AccountStatus
+
+
+# Shared constrained string types (one core-schema node reused by every field)
+E164Phone = Annotated[str, StringConstraints(pattern=r"^\+[1-9]\d{1,14}$")]
+Username = Annotated[str, StringConstraints(min_length=6, max_length=18, pattern=r"^[a-zA-Z][a-zA-Z0-9_.\-]{5,17}$")]
+OTPCode = Annotated[str, StringConstraints(min_length=6, max_length=6, pattern=r"^\d{6}$")]
+# Shape-only email check for hot paths; full EmailStr validation is kept for signup
+EmailLite = Annotated[str, StringConstraints(max_length=254, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")]
 
 
 class SignUpRequest(BaseModel):
     """Request schema for user sign up with username."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
     email: EmailStr = Field(..., description="User email address")
     password: str = Field(
         ...,
@@ -13,11 +23,8 @@ class SignUpRequest(BaseModel):
         max_length=128,
         description="Password: 8+ chars, uppercase, lowercase, number, special char"
     )
-    username: str = Field(
+    username: Username = Field(
         ...,
-        min_length=6,
-        max_length=18,
-        pattern=r"^[a-zA-Z][a-zA-Z0-9_.\-]{5,17}$",
         description="Username: 6-18 chars, starts with letter, allows letters, numbers, _, -, ."
     )
     full_name: Optional[str] = Field(None, description="User's full name")
@@ -25,12 +32,14 @@ class SignUpRequest(BaseModel):
 
 class SignInRequest(BaseModel):
     """Request schema for user sign in."""
-    email: EmailStr = Field(..., description="User email address")
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    email: EmailLite = Field(..., description="User email address")
     password: str = Field(..., description="User password")
 
 
 class UserResponse(BaseModel):
     """Response schema for user data."""
+    model_config = ConfigDict(frozen=True)
     id: str = Field(..., description="User ID")
     email: str = Field(..., description="User email")
     username: Optional[str] = Field(None, description="Username")
@@ -41,6 +50,7 @@ class UserResponse(BaseModel):
 
 class AuthResponse(BaseModel):
     """Response schema for authentication endpoints."""
+    model_config = ConfigDict(frozen=True)
     success: bool = Field(..., description="Whether the operation was successful")
     message: str = Field(..., description="Response message")
     user: Optional[UserResponse] = Field(None, description="User data if successful")
@@ -57,25 +67,22 @@ class ErrorResponse(BaseModel):
 
 class PhoneSignUpRequest(BaseModel):
     """Request schema for phone sign up (OTP request)."""
-    phone: str = Field(
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    phone: E164Phone = Field(
         ...,
-        pattern=r"^\+[1-9]\d{1,14}$",
         description="Phone number in E.164 format (e.g., +1234567890)"
     )
 
 
 class PhoneVerifyRequest(BaseModel):
     """Request schema for verifying phone OTP."""
-    phone: str = Field(
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    phone: E164Phone = Field(
         ...,
-        pattern=r"^\+[1-9]\d{1,14}$",
         description="Phone number in E.164 format"
     )
-    otp: str = Field(
+    otp: OTPCode = Field(
         ...,
-        min_length=6,
-        max_length=6,
-        pattern=r"^\d{6}$",
         description="6-digit OTP code"
     )
 
@@ -87,35 +94,22 @@ class OTPResponse(BaseModel):
     message_id: Optional[str] = Field(None, description="Message ID from SMS provider")
 
 
-class SubscriptionStatus(str, Enum):
-    """User subscription status."""
-    FREE = "free"
-    HOORAY = "hooray"
-    PRO = "pro"
-    ENTERPRISE = "enterprise"
-
-
-class AuthUserRole(str, Enum):
-    """User role in the system."""
-    FREE = "free"
-    PREMIUM = "premium"
-    ADMIN = "admin"
-
-
-class AccountStatus(str, Enum):
-    """User account status."""
-    ACTIVE = "active"
-    SUSPENDED = "suspended"
-    DELETED = "deleted"
-    PENDING_VERIFICATION = "pending_verification"
+class NotificationPreferences(TypedDict, total=False):
+    """User notification preferences (validated inline as a dict, no nested model).
+    Missing keys are filled from NOTIFICATION_PREFERENCE_DEFAULTS by UserProfile."""
+    email_marketing: bool
+    email_updates: bool
+    push_notifications: bool
+    sms_notifications: bool
 
 
-class NotificationPreferences(BaseModel):
-    """User notification preferences."""
-    email_marketing: bool = True
-    email_updates: bool = True
-    push_notifications: bool = True
-    sms_notifications: bool = False
+# Email/push on, SMS off
+NOTIFICATION_PREFERENCE_DEFAULTS: NotificationPreferences = {
+    "email_marketing": True,
+    "email_updates": True,
+    "push_notifications": True,
+    "sms_notifications": False,
+}
 
 
 class UserProfile(BaseModel):
@@ -123,8 +117,8 @@ class UserProfile(BaseModel):
     idx: Optional[int] = Field(None, description="Auto-increment ID")
     user_uuid: str = Field(..., description="Supabase auth user UUID")
     shard_num: Optional[int] = Field(None, ge=1, le=26, description="Shard 1-26 based on first letter of username")
-    username: Optional[str] = Field(None, min_length=6, max_length=18, pattern=r"^[a-zA-Z][a-zA-Z0-9_.\-]{5,17}$", description="Unique username")
-    email: EmailStr = Field(..., description="User email")
+    username: Optional[Username] = Field(None, description="Unique username")
+    email: EmailLite = Field(..., description="User email")
     name: Optional[str] = Field(None, description="Display name")
     user_info: Optional[Dict[str, Any]] = Field(None, description="Additional user metadata")
     subscription_status: SubscriptionStatus = Field(default=SubscriptionStatus.FREE)
@@ -136,7 +130,7 @@ class UserProfile(BaseModel):
     payment_customer_id: Optional[str] = None
     auth_user_role: AuthUserRole = Field(default=AuthUserRole.FREE)
     # Additional recommended fields
-    phone_number: Optional[str] = Field(None, pattern=r"^\+[1-9]\d{1,14}$")
+    phone_number: Optional[E164Phone] = None
     bio: Optional[str] = Field(None, max_length=500)
     location: Optional[str] = None
     timezone: Optional[str] = Field(None, description="IANA timezone (e.g., America/New_York)")
@@ -147,13 +141,13 @@ class UserProfile(BaseModel):
     referral_code: Optional[str] = None
     referred_by: Optional[str] = Field(None, description="Referrer's user_uuid")
 
-
-class SignUpRequestExtended(BaseModel):
-    """Extended signup request with username."""
-    email: EmailStr = Field(..., description="User email address")
-    password: str = Field(..., min_length=6, description="User password")
-    username: str = Field(..., min_length=3, max_length=30, pattern=r"^[a-zA-Z0-9_]+$", description="Unique username")
-    full_name: Optional[str] = Field(None, description="User's full name")
+    @field_validator("notification_preferences")
+    @classmethod
+    def _fill_notification_defaults(cls, v: Optional[NotificationPreferences]) -> Optional[NotificationPreferences]:
+        """Merge stored preferences over the defaults, so partial dicts come back complete."""
+        if v is None:
+            return None
+        return {**NOTIFICATION_PREFERENCE_DEFAULTS, **v}
 
 
 class UsernameCheckRequest(BaseModel):
@@ -161,13 +155,6 @@ class UsernameCheckRequest(BaseModel):
     username: str = Field(..., min_length=3, max_length=30, pattern=r"^[a-zA-Z0-9_]+$")
 
 
-class UsernameCheckResponse(BaseModel):
-    """Response for username availability check."""
-    available: bool
-    username: str
-    suggestions: Optional[List[str]] = Field(None, description="Alternative username suggestions if taken")
-
-
 class BloomFilterResponse(BaseModel):
     """Response containing Bloom filter data for usernames."""
     filter_data: str = Field(..., description="Base64 encoded Bloom filter bit array")
@@ -2,42 +2,50 @@
 Crawler models for web crawling with LLM citation support.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import Optional, List, Literal
-from datetime import datetime
-from enum import Enum
+from datetime import datetime, timezone
+from functools import partial
+from app.api.models.enums import CrawlerType, TriggerMode
 
 
-class CrawlerType(str, Enum):
-    """Crawler engine type."""
-    BEAUTIFULSOUP = "beautifulsoup"
-    PLAYWRIGHT = "playwright"
-    AUTO = "auto"
+# Field annotation for crawler types: validates as a plain string set lookup instead of
+# enum coercion. CrawlerType stays as the constant namespace for code that compares values;
+# pass CrawlerType.X.value to these fields, since Literal validation rejects enum members.
+CrawlerTypeName = Literal["beautifulsoup", "playwright", "auto"]
 
 
-class TriggerMode(str, Enum):
-    """How the crawl was triggered."""
-    EXPLICIT_URLS = "explicit_urls"
-    AUTO_SEARCH = "auto_search"
+# Timezone-aware replacement for the deprecated datetime.utcnow
+_utcnow = partial(datetime.now, timezone.utc)
 
 
 # === Citation Models ===
 
 class Citation(BaseModel):
     """Single citation reference."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: int = Field(..., description="Citation number (1, 2, 3...)")
     url: str = Field(..., description="Full URL of the cited page")
     root_url: str = Field(..., description="Root domain (e.g., https://example.com)")
     title: str = Field(..., description="Page title")
     snippet: Optional[str] = Field(None, description="Relevant text snippet from source")
     favicon_url: Optional[str] = Field(None, description="Site favicon URL")
-    crawled_at: datetime = Field(default_factory=datetime.utcnow)
-    crawler_type: CrawlerType = Field(default=CrawlerType.AUTO)
+    crawled_at: datetime = Field(default_factory=_utcnow)
+    crawler_type: CrawlerTypeName = Field(default="auto")
+
+
+# Serializer for bare citation lists: dumps already-built Citation objects in one
+# pydantic-core call instead of a model_dump() per citation.
+CITATIONS_ADAPTER: TypeAdapter[list[Citation]] = TypeAdapter(list[Citation])
 
 
 class CitationList(BaseModel):
-    """Collection of citations for a response."""
-    citations: List[Citation] = Field(default_factory=list)
+    """Collection of citations for a response.
+    Built from already-validated Citation objects; use model_construct on internal paths."""
+    model_config = ConfigDict(revalidate_instances="never")
+
+    citations: list[Citation] = Field(default_factory=list)
     total_count: int = Field(default=0)
 
 
@@ -45,6 +53,8 @@ class CitationList(BaseModel):
 
 class CrawledPage(BaseModel):
     """Single crawled page content."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     url: str
     root_url: str
     title: Optional[str] = None
@@ -52,13 +62,16 @@ class CrawledPage(BaseModel):
     html_snippet: Optional[str] = Field(None, description="Relevant HTML if needed")
     meta_description: Optional[str] = None
     crawl_time_ms: int = Field(default=0)
-    crawler_used: CrawlerType = CrawlerType.AUTO
+    crawler_used: CrawlerTypeName = "auto"
     error: Optional[str] = None
 
 
 class CrawlResult(BaseModel):
-    """Result of a crawl operation."""
-    pages: List[CrawledPage] = Field(default_factory=list)
+    """Result of a crawl operation.
+    Built from already-validated CrawledPage objects; use model_construct on internal paths."""
+    model_config = ConfigDict(revalidate_instances="never")
+
+    pages: list[CrawledPage] = Field(default_factory=list)
     total_pages: int = Field(default=0)
     successful_pages: int = Field(default=0)
     failed_pages: int = Field(default=0)
@@ -70,7 +83,7 @@ class CrawlResult(BaseModel):
 class CrawlRequest(BaseModel):
     """Request to crawl specific URLs."""
     urls: List[str] = Field(..., min_length=1, max_length=10, description="URLs to crawl")
-    crawler_type: CrawlerType = Field(default=CrawlerType.AUTO)
+    crawler_type: CrawlerTypeName = Field(default="auto")
     extract_links: bool = Field(default=False, description="Also extract outbound links")
     max_depth: int = Field(default=1, ge=1, le=3, description="Max crawl depth")
 
@@ -79,16 +92,24 @@ class SearchAndCrawlRequest(BaseModel):
     """Request to search web and crawl results for citation-based responses."""
     query: str = Field(..., min_length=1, max_length=500, description="Search query")
     max_results: int = Field(default=5, ge=1, le=10, description="Max search results to crawl")
-    crawler_type: CrawlerType = Field(default=CrawlerType.AUTO)
+    crawler_type: CrawlerTypeName = Field(default="auto")
     search_engine: Literal["google", "duckduckgo", "brave"] = Field(default="duckduckgo")
 
 
 class ChatMessage(BaseModel):
     """Chat message for history."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     role: Literal["user", "assistant", "system"]
     content: str
 
 
+# Validator for bare chat history lists. Internal pipelines (stream handlers, background
+# tasks) should call CHAT_HISTORY_ADAPTER.validate_python(data) instead of wrapping the
+# history in a WebChatRequest just to validate it.
+CHAT_HISTORY_ADAPTER: TypeAdapter[list[ChatMessage]] = TypeAdapter(list[ChatMessage])
+
+
 class WebChatRequest(BaseModel):
     """Chat request with web crawling support."""
     message: str = Field(..., min_length=1, max_length=10000)
@@ -100,7 +121,7 @@ class WebChatRequest(BaseModel):
     # Web crawling options
     web_search_enabled: bool = Field(default=False, description="Enable agentic web search with citations")
     urls: Optional[List[str]] = Field(None, max_length=10, description="Explicit URLs to crawl")
-    crawler_type: CrawlerType = Field(default=CrawlerType.AUTO)
+    crawler_type: CrawlerTypeName = Field(default="auto")
     include_citations: bool = Field(default=True)
 
 
@@ -108,6 +129,8 @@ class WebChatRequest(BaseModel):
 
 class CrawlResponse(BaseModel):
     """Response from a crawl operation."""
+    model_config = ConfigDict(revalidate_instances="never")
+
     success: bool
     result: Optional[CrawlResult] = None
     error: Optional[str] = None
@@ -128,6 +151,8 @@ class WebChatResponse(BaseModel):
 
 class StreamChunk(BaseModel):
     """Streaming response chunk."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     type: Literal["content", "citation", "status", "done", "error"]
     content: Optional[str] = None
     citation: Optional[Citation] = None
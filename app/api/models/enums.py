@@ -0,0 +1,45 @@
+"""
+Shared str-enums for API models, defined once and imported by auth.py and crawler.py.
+"""
+
+from enum import Enum
+
+
+# === Crawler ===
+
+class CrawlerType(str, Enum):
+    """Crawler engine type."""
+    BEAUTIFULSOUP = "beautifulsoup"
+    PLAYWRIGHT = "playwright"
+    AUTO = "auto"
+
+
+class TriggerMode(str, Enum):
+    """How the crawl was triggered."""
+    EXPLICIT_URLS = "explicit_urls"
+    AUTO_SEARCH = "auto_search"
+
+
+# === Auth ===
+
+class SubscriptionStatus(str, Enum):
+    """User subscription status."""
+    FREE = "free"
+    HOORAY = "hooray"
+    PRO = "pro"
+    ENTERPRISE = "enterprise"
+
+
+class AuthUserRole(str, Enum):
+    """User role in the system."""
+    FREE = "free"
+    PREMIUM = "premium"
+    ADMIN = "admin"
+
+
+class AccountStatus(str, Enum):
+    """User account status."""
+    ACTIVE = "active"
+    SUSPENDED = "suspended"
+    DELETED = "deleted"
+    PENDING_VERIFICATION = "pending_verification"
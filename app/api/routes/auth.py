@@ -1,12 +1,17 @@
+import asyncio
+import hashlib
 import logging
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import Optional, List
+import random
+from functools import lru_cache, wraps
+from fastapi import APIRouter, HTTPException, status, Depends, Request
+from fastapi.responses import Response
+from typing import List, Optional, Tuple
 from app.config.settings import settings
+from app.services.cache import TTLCache
 from app.api.models.auth import (
     SignUpRequest,
     SignInRequest,
     AuthResponse,
-    ErrorResponse,
     UserResponse,
     PhoneSignUpRequest,
     PhoneVerifyRequest,
@@ -18,196 +23,283 @@ from app.api.models.auth import (
     BloomFilterResponse,
     UsernameCheckRequest
 )
+from app.api.routing import ORJSONRoute
 from app.api.dependencies.auth import get_current_user, TokenPayload
+from app.api.dependencies.rate_limit import signin_limiter, signup_limiter, refresh_limiter, send_otp_limiter
 from app.services.user_service import (
     validate_username,
-    check_username_exists,
     sync_user_signup,
     sync_user_signin,
     sync_user_signout,
-    get_user_by_uuid
+    get_user_by_uuid,
+    get_cached_user,
+    invalidate_user_cache
 )
 from app.services.password_service import (
     validate_password,
-    calculate_password_strength
+    calculate_password_strength,
+    MAX_LENGTH as PASSWORD_MAX_LENGTH
 )
 from app.services.bloom_filter_service import (
-    check_username_availability_fast,
+    filter_available_usernames,
     check_username_availability_definitive,
-    get_bloom_filter_data,
+    get_loaded_bloom_filter,
+    get_bloom_filter_payload,
+    get_bloom_filter_raw,
     generate_random_username,
     generate_username_suggestions,
     add_username_to_filter
 )
 
 try:
-    from supabase import create_client
+    from supabase import create_client, ClientOptions
 except ImportError:
     raise ImportError("Supabase client is not installed. Install it with: pip install supabase")
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/auth", tags=["authentication"])
+router = APIRouter(
+    prefix="/auth",
+    tags=["authentication"],
+    route_class=ORJSONRoute,
+)
+
+# Recently rejected (email, password) pairs; repeats are answered without calling Supabase
+_failed_signins = TTLCache(max_entries=50000, ttl_seconds=30)
+# Same detail whether the rejection comes from Supabase or from _failed_signins
+_INVALID_CREDENTIALS_DETAIL = "Invalid email or password"
+
+
+def _signin_cache_key(email: str, password: str) -> bytes:
+    """Hash the credential pair so no plaintext password is kept in memory."""
+    return hashlib.sha256(f"{email.lower()}\0{password}".encode()).digest()[:16]
+
+
+def _is_invalid_credentials_error(e: Exception) -> bool:
+    """True for Supabase's definitive wrong-credentials rejection (not network or rate-limit errors)."""
+    return getattr(e, "code", None) == "invalid_credentials" or "invalid login credentials" in str(e).lower()
+
+
+def _http_errors(status_code: int, message: str, include_error: bool = False):
+    """Route decorator: HTTPExceptions pass through, anything else becomes one
+    HTTPException(status_code, message[: error]) instead of per-route try/except blocks."""
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                raise HTTPException(
+                    status_code=status_code,
+                    detail=f"{message}: {e}" if include_error else message
+                )
+        return wrapper
+    return decorator
+
+
+async def _check_username_available(username: str) -> Tuple[bool, str]:
+    """Probe the loaded Bloom filter on the event loop; only go to the DB (in a worker thread)
+    when the filter is not loaded/fresh or says the name may be taken."""
+    bf = get_loaded_bloom_filter()
+    if bf is not None and not bf.might_contain(username.lower()):
+        return True, "Username is available"
+    return await asyncio.to_thread(check_username_availability_definitive, username)
 
 
+async def _username_suggestions(username: str, count: int) -> List[str]:
+    """Generate suggestions on the event loop only while the Bloom filter is loaded and fresh;
+    otherwise the filter (re)load is a full table scan, so run it in a worker thread."""
+    if get_loaded_bloom_filter() is not None:
+        return generate_username_suggestions(username, count=count)
+    return await asyncio.to_thread(generate_username_suggestions, username, count)
+
+
+def _to_user_response(user, profile: Optional[dict] = None, **fields) -> UserResponse:
+    """Build a UserResponse from a Supabase auth user (plus its auth_users_table row, if any),
+    reading each attribute once. Extra fields (username, full_name) override the profile.
+    Uses model_construct: the input is Supabase's own typed user object, and the route's
+    response_model validates the output anyway."""
+    if profile:
+        fields.setdefault("username", profile.get("username"))
+        fields.setdefault("full_name", profile.get("name"))
+    return UserResponse.model_construct(
+        id=user.id,
+        email=user.email or "",
+        created_at=getattr(user, "created_at", None),
+        last_sign_in_at=getattr(user, "last_sign_in_at", None),
+        **fields,
+    )
+
+
+@lru_cache(maxsize=1)
 def get_supabase_client():
-    """Initialize and return Supabase client."""
+    """Return the process-wide Supabase client for auth calls.
+
+    Shared across requests, so it must only be used for auth calls that take their
+    credentials explicitly (sign_up, sign_in_*, refresh_session, verify_otp) - never
+    for table queries, which would run as whichever user signed in last. Session
+    persistence and background token refresh are disabled for the same reason.
+    """
     if not settings.supabase_url or not settings.supabase_key:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Supabase credentials not configured"
         )
-    return create_client(settings.supabase_url, settings.supabase_key)
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_key,
+        options=ClientOptions(persist_session=False, auto_refresh_token=False),
+    )
 
 
-@router.post("/signup", response_model=AuthResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/signup",
+    response_model=AuthResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(signup_limiter)],
+)
+@_http_errors(status.HTTP_400_BAD_REQUEST, "Sign up failed", include_error=True)
 async def signup(request: SignUpRequest) -> AuthResponse:
     """Register new user. Validates password (password_service) and username (user_service), checks availability (bloom_filter_service), creates account via Supabase Auth, syncs profile to auth_users_table. Called by: frontend AuthModal."""
-    try:
-        # Validate password complexity
-        pwd_valid, pwd_error, pwd_issues = validate_password(request.password)
-        if not pwd_valid:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=pwd_error
-            )
+    # Validate password complexity
+    pwd_valid, pwd_error, pwd_issues = validate_password(request.password)
+    if not pwd_valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=pwd_error
+        )
 
-        # Validate username format
-        is_valid, error_msg = validate_username(request.username)
-        if not is_valid:
+    # Validate username format
+    is_valid, error_msg = validate_username(request.username)
+    if not is_valid:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_msg
+        )
+
+    # Check username availability using Bloom filter (probabilistic check)
+    # This is a soft check - actual uniqueness is enforced by DB constraints
+    try:
+        available, msg = await _check_username_available(request.username)
+        if not available:
+            suggestions = await _username_suggestions(request.username, count=3)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=error_msg
+                detail=f"Username already taken. Suggestions: {', '.join(suggestions)}"
             )
+    except HTTPException:
+        raise
+    except Exception:
+        pass  # If Bloom filter check fails, proceed - DB will enforce uniqueness
 
-        # Check username availability using Bloom filter (probabilistic check)
-        # This is a soft check - actual uniqueness is enforced by DB constraints
-        try:
-            available, msg = check_username_availability_definitive(request.username)
-            if not available:
-                suggestions = generate_username_suggestions(request.username, count=3)
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Username already taken. Suggestions: {', '.join(suggestions)}"
-                )
-        except HTTPException:
-            raise
-        except Exception:
-            pass  # If Bloom filter check fails, proceed - DB will enforce uniqueness
-
-        supabase = get_supabase_client()
-
-        # Sign up user with Supabase Auth
-        response = supabase.auth.sign_up({
-            "email": request.email,
-            "password": request.password,
-        })
+    supabase = get_supabase_client()
 
-        if response.user is None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Failed to create user account"
-            )
+    # Sign up user with Supabase Auth (sync SDK call, run off the event loop)
+    response = await asyncio.to_thread(supabase.auth.sign_up, {
+        "email": request.email,
+        "password": request.password,
+    })
 
-        user = response.user
+    if response.user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to create user account"
+        )
 
-        # Sync to auth_users_table
-        sync_error = None
-        try:
-            sync_user_signup(
-                user_uuid=user.id,
-                email=user.email,
-                username=request.username,
-                name=request.full_name
-            )
-            add_username_to_filter(request.username)
-        except Exception as e:
-            sync_error = str(e)
+    user = response.user
 
-        user_response = UserResponse(
-            id=user.id,
+    # Sync to auth_users_table (the only DB write); the Bloom filter update is in-memory
+    sync_error = None
+    try:
+        await asyncio.to_thread(
+            sync_user_signup,
+            user_uuid=user.id,
             email=user.email,
-            username=request.username.lower(),
-            full_name=request.full_name,
-            created_at=user.created_at if hasattr(user, 'created_at') else None
+            username=request.username,
+            name=request.full_name
         )
+    except Exception as e:
+        sync_error = str(e)
+    add_username_to_filter(request.username)
 
-        message = "Account created successfully. Check your email for verification."
-        if sync_error:
-            message = f"Account created but profile sync failed: {sync_error}"
+    user_response = _to_user_response(
+        user,
+        username=request.username.lower(),
+        full_name=request.full_name,
+    )
 
-        return AuthResponse(
-            success=True,
-            message=message,
-            user=user_response,
-            access_token=response.session.access_token if response.session else None,
-            refresh_token=response.session.refresh_token if response.session else None
-        )
+    message = "Account created successfully. Check your email for verification."
+    if sync_error:
+        message = f"Account created but profile sync failed: {sync_error}"
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Sign up failed: {str(e)}"
-        )
+    return AuthResponse(
+        success=True,
+        message=message,
+        user=user_response,
+        access_token=response.session.access_token if response.session else None,
+        refresh_token=response.session.refresh_token if response.session else None
+    )
 
 
-@router.post("/signin", response_model=AuthResponse)
+@router.post("/signin", response_model=AuthResponse, dependencies=[Depends(signin_limiter)])
+@_http_errors(status.HTTP_401_UNAUTHORIZED, "Sign in failed")
 async def signin(request: SignInRequest) -> AuthResponse:
     """Authenticate user via Supabase Auth. Updates last_login_at via user_service.sync_user_signin,
     fetches profile for username. Called by: frontend AuthModal."""
-    try:
-        supabase = get_supabase_client()
+    cache_key = _signin_cache_key(request.email, request.password)
+    if _failed_signins.get(cache_key):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=_INVALID_CREDENTIALS_DETAIL
+        )
 
-        # Sign in user with Supabase Auth
-        response = supabase.auth.sign_in_with_password({
+    supabase = get_supabase_client()
+
+    # Sign in user with Supabase Auth (sync SDK call, run off the event loop)
+    try:
+        response = await asyncio.to_thread(supabase.auth.sign_in_with_password, {
             "email": request.email,
             "password": request.password
         })
-
-        if response.user is None or response.session is None:
+    except Exception as e:
+        if _is_invalid_credentials_error(e):
+            _failed_signins.set(cache_key, True)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid email or password"
+                detail=_INVALID_CREDENTIALS_DETAIL
             )
+        raise
 
-        user = response.user
-        session = response.session
+    if response.user is None or response.session is None:
+        _failed_signins.set(cache_key, True)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=_INVALID_CREDENTIALS_DETAIL
+        )
 
-        # Sync signin to auth_users_table (update last_login_at)
-        try:
-            sync_user_signin(user.id)
-        except Exception as e:
-            logger.warning(f"Could not sync signin: {e}")
+    user = response.user
+    session = response.session
 
-        # Get user profile for username
-        profile = get_user_by_uuid(user.id)
+    # Sync signin to auth_users_table (update last_login_at)
+    try:
+        await asyncio.to_thread(sync_user_signin, user.id)
+    except Exception as e:
+        logger.warning("Could not sync signin: %s", e)
 
-        user_response = UserResponse(
-            id=user.id,
-            email=user.email,
-            username=profile.get("username") if profile else None,
-            full_name=profile.get("name") if profile else None,
-            created_at=user.created_at if hasattr(user, 'created_at') else None,
-            last_sign_in_at=user.last_sign_in_at if hasattr(user, 'last_sign_in_at') else None
-        )
+    # Get user profile for username
+    profile = await asyncio.to_thread(get_user_by_uuid, user.id)
 
-        return AuthResponse(
-            success=True,
-            message="Sign in successful",
-            user=user_response,
-            access_token=session.access_token,
-            refresh_token=session.refresh_token
-        )
+    user_response = _to_user_response(user, profile)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Sign in failed"
-        )
+    return AuthResponse(
+        success=True,
+        message="Sign in successful",
+        user=user_response,
+        access_token=session.access_token,
+        refresh_token=session.refresh_token
+    )
 
 
 @router.post("/signout")
@@ -217,9 +309,9 @@ async def signout(
     """Sign out user. Updates auth_users_table via user_service.sync_user_signout.
     Called by: frontend useAuth hook."""
     try:
-        sync_user_signout(current_user.sub)
+        await asyncio.to_thread(sync_user_signout, current_user.sub)
     except Exception as e:
-        logger.warning(f"Could not sync signout: {e}")
+        logger.warning("Could not sync signout: %s", e)
 
     return {
         "success": True,
@@ -227,46 +319,34 @@ async def signout(
     }
 
 
-@router.post("/refresh-token")
+@router.post("/refresh-token", dependencies=[Depends(refresh_limiter)])
+@_http_errors(status.HTTP_401_UNAUTHORIZED, "Token refresh failed")
 async def refresh_token(refresh_token: str) -> AuthResponse:
     """Exchange refresh token for new access token via Supabase Auth.
     Called by: frontend auth interceptor."""
-    try:
-        supabase = get_supabase_client()
-        
-        response = supabase.auth.refresh_session(refresh_token)
-        
-        if response.session is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired refresh token"
-            )
-        
-        session = response.session
-        user = response.user
-        
-        user_response = UserResponse(
-            id=user.id,
-            email=user.email,
-            created_at=user.created_at if hasattr(user, 'created_at') else None
-        )
-        
-        return AuthResponse(
-            success=True,
-            message="Token refreshed successfully",
-            user=user_response,
-            access_token=session.access_token,
-            refresh_token=session.refresh_token
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    supabase = get_supabase_client()
+
+    response = await asyncio.to_thread(supabase.auth.refresh_session, refresh_token)
+
+    if response.session is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token refresh failed"
+            detail="Invalid or expired refresh token"
         )
 
+    session = response.session
+    user = response.user
+
+    user_response = _to_user_response(user)
+
+    return AuthResponse(
+        success=True,
+        message="Token refreshed successfully",
+        user=user_response,
+        access_token=session.access_token,
+        refresh_token=session.refresh_token
+    )
+
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
@@ -274,8 +354,8 @@ async def get_current_user_info(
 ) -> UserResponse:
     """Return current user info from auth_users_table via user_service.get_user_by_uuid.
     Called by: frontend useAuth hook."""
-    # Fetch user profile from auth_users_table
-    profile = get_user_by_uuid(current_user.sub)
+    # Fetch user profile from auth_users_table; cache hits skip the worker-thread hop
+    profile = get_cached_user(current_user.sub) or await asyncio.to_thread(get_user_by_uuid, current_user.sub)
 
     if profile:
         return UserResponse(
@@ -302,7 +382,7 @@ async def get_user_profile(
 ) -> dict:
     """Return full profile with subscription and role data from auth_users_table.
     Called by: frontend profile page."""
-    profile = get_user_by_uuid(current_user.sub)
+    profile = get_cached_user(current_user.sub) or await asyncio.to_thread(get_user_by_uuid, current_user.sub)
 
     if not profile:
         raise HTTPException(
@@ -329,6 +409,7 @@ async def get_user_profile(
 
 
 @router.put("/profile")
+@_http_errors(status.HTTP_400_BAD_REQUEST, "Failed to update profile", include_error=True)
 async def update_user_profile(
     current_user: TokenPayload = Depends(get_current_user),
     name: Optional[str] = None,
@@ -337,117 +418,100 @@ async def update_user_profile(
     """Update name/avatar in auth_users_table via Supabase admin client.
     Called by: frontend profile page."""
     from app.services.user_service import get_supabase_admin_client
-    from datetime import datetime, timezone
 
     supabase = get_supabase_admin_client()
 
-    update_data = {"updated_at": datetime.now(timezone.utc).isoformat()}
+    # 'now' is a Postgres timestamptz input literal, so the DB stamps updated_at itself
+    update_data = {"updated_at": "now"}
     if name is not None:
         update_data["name"] = name
     if profile_image_url is not None:
         update_data["profile_image_url"] = profile_image_url
 
-    try:
-        result = supabase.table("auth_users_table").update(update_data).eq(
-            "user_uuid", current_user.sub
-        ).execute()
-
-        if not result.data:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Profile not found"
-            )
+    query = supabase.table("auth_users_table").update(update_data).eq(
+        "user_uuid", current_user.sub
+    )
+    result = await asyncio.to_thread(query.execute)
+    invalidate_user_cache(current_user.sub)
 
-        return {
-            "success": True,
-            "message": "Profile updated",
-            "profile": result.data[0]
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
+    if not result.data:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to update profile: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
         )
 
+    return {
+        "success": True,
+        "message": "Profile updated",
+        "profile": result.data[0]
+    }
 
-@router.post("/phone/send-otp", response_model=OTPResponse)
-async def send_phone_otp(request: PhoneSignUpRequest) -> OTPResponse:
-    """Send SMS OTP via Supabase phone auth. Called by: frontend AuthModal phone tab."""
-    try:
-        supabase = get_supabase_client()
-
-        # Send OTP via Supabase phone auth
-        response = supabase.auth.sign_in_with_otp({
-            "phone": request.phone
-        })
-
-        return OTPResponse(
-            success=True,
-            message="OTP sent successfully. Check your phone for the verification code.",
-            message_id=getattr(response, 'message_id', None)
-        )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to send OTP: {str(e)}"
-        )
+@router.post("/phone/send-otp", response_model=OTPResponse)
+@_http_errors(status.HTTP_400_BAD_REQUEST, "Failed to send OTP", include_error=True)
+async def send_phone_otp(request: PhoneSignUpRequest, response: Response) -> OTPResponse:
+    """Send SMS OTP via Supabase phone auth. Rate limited per phone number (X-RateLimit-* headers
+    on success, like the other limited routes). Called by: frontend AuthModal phone tab."""
+    send_otp_limiter.hit(request.phone, response)
+
+    supabase = get_supabase_client()
+
+    # Send OTP via Supabase phone auth
+    otp_response = await asyncio.to_thread(supabase.auth.sign_in_with_otp, {
+        "phone": request.phone
+    })
+
+    return OTPResponse(
+        success=True,
+        message="OTP sent successfully. Check your phone for the verification code.",
+        message_id=getattr(otp_response, 'message_id', None)
+    )
 
 
 @router.post("/phone/verify-otp", response_model=AuthResponse)
+@_http_errors(status.HTTP_401_UNAUTHORIZED, "OTP verification failed", include_error=True)
 async def verify_phone_otp(request: PhoneVerifyRequest) -> AuthResponse:
     """Verify phone OTP and return session tokens. Called by: frontend AuthModal phone verification."""
-    try:
-        supabase = get_supabase_client()
+    supabase = get_supabase_client()
 
-        # Verify OTP via Supabase
-        response = supabase.auth.verify_otp({
-            "phone": request.phone,
-            "token": request.otp,
-            "type": "sms"
-        })
+    # Verify OTP via Supabase
+    response = await asyncio.to_thread(supabase.auth.verify_otp, {
+        "phone": request.phone,
+        "token": request.otp,
+        "type": "sms"
+    })
 
-        if response.user is None or response.session is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid or expired OTP"
-            )
-
-        user = response.user
-        session = response.session
-
-        user_response = UserResponse(
-            id=user.id,
-            email=user.email or "",
-            created_at=user.created_at if hasattr(user, 'created_at') else None,
-            last_sign_in_at=user.last_sign_in_at if hasattr(user, 'last_sign_in_at') else None
-        )
-
-        return AuthResponse(
-            success=True,
-            message="Phone verification successful",
-            user=user_response,
-            access_token=session.access_token,
-            refresh_token=session.refresh_token
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
+    if response.user is None or response.session is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"OTP verification failed: {str(e)}"
+            detail="Invalid or expired OTP"
         )
 
+    user = response.user
+    session = response.session
+
+    user_response = _to_user_response(user)
+
+    return AuthResponse(
+        success=True,
+        message="Phone verification successful",
+        user=user_response,
+        access_token=session.access_token,
+        refresh_token=session.refresh_token
+    )
+
 
 @router.post("/validate-password", response_model=PasswordValidationResponse)
 async def validate_password_endpoint(request: PasswordValidationRequest) -> PasswordValidationResponse:
     """Check password strength via password_service.validate_password and calculate_password_strength.
     Called by: frontend signup form (real-time validation)."""
-    is_valid, error_msg, issues = validate_password(request.password)
-    strength = calculate_password_strength(request.password)
+    if len(request.password) > PASSWORD_MAX_LENGTH:
+        # This endpoint does not cap input length; scan oversized input in a worker thread
+        is_valid, error_msg, issues = await asyncio.to_thread(validate_password, request.password)
+        strength = await asyncio.to_thread(calculate_password_strength, request.password)
+    else:
+        is_valid, error_msg, issues = validate_password(request.password)
+        strength = calculate_password_strength(request.password)
 
     return PasswordValidationResponse(
         valid=is_valid,
@@ -458,80 +522,75 @@ async def validate_password_endpoint(request: PasswordValidationRequest) -> Pass
     )
 
 
-@router.post("/check-username", response_model=UsernameAvailabilityResponse)
-async def check_username_endpoint(request: UsernameCheckRequest) -> UsernameAvailabilityResponse:
-    """Check username availability via bloom_filter_service (fast) then DB verification.
-    Returns suggestions if taken. Called by: frontend signup form."""
-    # Validate format first
-    is_valid, error_msg = validate_username(request.username)
-    if not is_valid:
-        return UsernameAvailabilityResponse(
-            username=request.username,
-            available=False,
-            message=error_msg,
-            suggestions=None
-        )
+def _invalid_username_response(username: str) -> Optional[UsernameAvailabilityResponse]:
+    """Synchronous format check for the username routes; returns the rejection response for
+    malformed names so they are answered without creating the availability coroutine."""
+    is_valid, error_msg = validate_username(username)
+    if is_valid:
+        return None
+    return UsernameAvailabilityResponse(
+        username=username,
+        available=False,
+        message=error_msg,
+        suggestions=None
+    )
 
+
+async def _check_username_impl(username: str, suggestion_count: int) -> UsernameAvailabilityResponse:
+    """Shared body of the POST and GET username checks for well-formed names: Bloom filter + DB
+    availability, then suggestions if taken."""
     # Check availability with Bloom filter + DB
     try:
-        available, message = check_username_availability_definitive(request.username)
-    except Exception as e:
+        available, message = await _check_username_available(username)
+    except Exception:
         # If check fails, assume available (DB will enforce uniqueness on signup)
-        logger.warning(f"Username check failed: {e}")
+        logger.warning("Username check failed", exc_info=True)
         available = True
         message = "Username appears available"
 
     suggestions = None
     if not available:
         try:
-            suggestions = generate_username_suggestions(request.username, count=5)
+            suggestions = await _username_suggestions(username, count=suggestion_count)
         except Exception:
             suggestions = []
 
     return UsernameAvailabilityResponse(
-        username=request.username,
+        username=username,
         available=available,
         message=message,
         suggestions=suggestions
     )
 
 
+@router.post("/check-username", response_model=UsernameAvailabilityResponse)
+async def check_username_endpoint(request: UsernameCheckRequest) -> UsernameAvailabilityResponse:
+    """Check username availability via bloom_filter_service (fast) then DB verification.
+    Returns suggestions if taken. Called by: frontend signup form."""
+    invalid = _invalid_username_response(request.username)
+    if invalid is not None:
+        return invalid
+    return await _check_username_impl(request.username, suggestion_count=5)
+
+
 @router.get("/check-username/{username}", response_model=UsernameAvailabilityResponse)
 async def check_username_get(username: str) -> UsernameAvailabilityResponse:
     """GET version of username check for simpler client usage. Same logic as POST check_username.
     Called by: frontend signup form (debounced input)."""
-    # Validate format first
-    is_valid, error_msg = validate_username(username)
-    if not is_valid:
-        return UsernameAvailabilityResponse(
-            username=username,
-            available=False,
-            message=error_msg,
-            suggestions=None
-        )
+    invalid = _invalid_username_response(username)
+    if invalid is not None:
+        return invalid
+    return await _check_username_impl(username, suggestion_count=3)
 
-    # Check with Bloom filter + optional DB verification
-    try:
-        available, message = check_username_availability_definitive(username)
-    except Exception as e:
-        # If check fails, assume available (DB will enforce uniqueness on signup)
-        logger.warning(f"Username check failed: {e}")
-        available = True
-        message = "Username appears available"
 
-    suggestions = None
-    if not available:
-        try:
-            suggestions = generate_username_suggestions(username, count=3)
-        except Exception:
-            suggestions = []
+# Random names drawn per /generate-username call (primary + 4 suggestions, with headroom for taken ones)
+USERNAME_CANDIDATES = 14
 
-    return UsernameAvailabilityResponse(
-        username=username,
-        available=available,
-        message=message,
-        suggestions=suggestions
-    )
+# Fallback name parts if the Bloom-backed generator fails; the module-local RNG keeps it
+# off the shared global random instance
+_FALLBACK_ADJECTIVES = ("swift", "bright", "cosmic", "cyber", "digital", "epic")
+_FALLBACK_NOUNS = ("coder", "dragon", "eagle", "ninja", "phoenix", "wolf")
+_FALLBACK_RNG = random.Random()
 
 
 @router.get("/generate-username", response_model=RandomUsernameResponse)
@@ -539,71 +598,121 @@ async def generate_username_endpoint() -> RandomUsernameResponse:
     """Generate random available username via bloom_filter_service. Returns primary + 4 suggestions.
     Called by: frontend signup form."""
     try:
-        username = generate_random_username()
+        # Draw every candidate up front and probe them against the Bloom filter in one pass
+        candidates = [generate_random_username() for _ in range(USERNAME_CANDIDATES)]
+        try:
+            if get_loaded_bloom_filter() is not None:
+                available = filter_available_usernames(candidates)
+            else:
+                available = await asyncio.to_thread(filter_available_usernames, candidates)
+        except Exception:
+            # If check fails, just use the generated usernames
+            available = candidates
 
-        # Ensure it's likely available using Bloom filter
-        attempts = 0
-        while attempts < 10:
-            try:
-                available, _ = check_username_availability_fast(username)
-                if available:
-                    break
-            except Exception:
-                # If check fails, just use the generated username
-                break
-            username = generate_random_username()
-            attempts += 1
-
-        # Generate additional suggestions
-        suggestions = []
-        for _ in range(4):
-            try:
-                suggestion = generate_random_username()
-                available, _ = check_username_availability_fast(suggestion)
-                if available and suggestion != username:
-                    suggestions.append(suggestion)
-            except Exception:
-                # If check fails, still add the suggestion
-                suggestion = generate_random_username()
-                if suggestion != username:
-                    suggestions.append(suggestion)
+        # dict.fromkeys dedupes while keeping order
+        available = list(dict.fromkeys(available))
+        username = available[0] if available else candidates[0]
+        suggestions = [name for name in available if name != username][:4]
 
         return RandomUsernameResponse(
             username=username,
             suggestions=suggestions
         )
-    except Exception as e:
+    except Exception:
         # Fallback: return a simple random username
-        import random
-        adjectives = ["swift", "bright", "cosmic", "cyber", "digital", "epic"]
-        nouns = ["coder", "dragon", "eagle", "ninja", "phoenix", "wolf"]
-        adj = random.choice(adjectives)
-        noun = random.choice(nouns)
-        num = random.randint(10, 999)
+        logger.warning("Username generation failed", exc_info=True)
+        adj = _FALLBACK_RNG.choice(_FALLBACK_ADJECTIVES)
+        noun = _FALLBACK_RNG.choice(_FALLBACK_NOUNS)
+        num = _FALLBACK_RNG.randint(10, 999)
         return RandomUsernameResponse(
             username=f"{adj}_{noun}{num}",
             suggestions=[]
         )
 
 
+def _accept_quality(accept: str, media_type: str) -> float:
+    """q-value the Accept header gives media_type, taken from its most specific matching range."""
+    main_type = media_type.split("/", 1)[0]
+    best_specificity, quality = -1, 0.0
+    for entry in accept.split(","):
+        media_range, *params = entry.split(";")
+        media_range = media_range.strip().lower()
+        if media_range == media_type:
+            specificity = 2
+        elif media_range == f"{main_type}/*":
+            specificity = 1
+        elif media_range == "*/*":
+            specificity = 0
+        else:
+            continue
+        if specificity <= best_specificity:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        best_specificity, quality = specificity, q
+    return quality
+
+
+def _prefers_raw_bloom_filter(accept: Optional[str]) -> bool:
+    """True when the client weights application/octet-stream above JSON (ties go to JSON)."""
+    if not accept:
+        return False
+    return _accept_quality(accept, "application/octet-stream") > _accept_quality(accept, "application/json")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): any listed tag, ignoring W/, or *."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
 @router.get("/bloom-filter", response_model=BloomFilterResponse)
-async def get_bloom_filter_endpoint() -> BloomFilterResponse:
+async def get_bloom_filter_endpoint(request: Request):
     """Export Bloom filter as base64 for client-side instant username checking without round-trips.
-    Called by: frontend AuthModal on mount."""
+    The encoded body is cached per filter version and served with an ETag; a matching
+    If-None-Match gets an empty 304. Clients whose Accept weights application/octet-stream above
+    application/json get the raw bit array with metadata in X-Bloom-* headers instead. Called by: frontend AuthModal on mount."""
     from datetime import datetime, timezone
 
     try:
-        data = get_bloom_filter_data()
-        return BloomFilterResponse(
-            filter_data=data["filter_data"],
-            hash_count=data["hash_count"],
-            size=data["size"],
-            item_count=data["item_count"],
-            last_updated=datetime.fromisoformat(data["last_updated"])
-        )
+        if _prefers_raw_bloom_filter(request.headers.get("accept")):
+            export, media_type = get_bloom_filter_raw, "application/octet-stream"
+        else:
+            export, media_type = get_bloom_filter_payload, "application/json"
+
+        if get_loaded_bloom_filter() is not None:
+            result = export()
+        else:
+            result = await asyncio.to_thread(export)
+
+        headers = {"ETag": result[2], "Cache-Control": "no-cache", "Vary": "Accept"}
+        if media_type == "application/octet-stream":
+            body, meta, _ = result
+            headers.update({
+                "X-Bloom-Hash-Count": str(meta["hash_count"]),
+                "X-Bloom-Size": str(meta["size"]),
+                "X-Bloom-Item-Count": str(meta["item_count"]),
+                "X-Bloom-Last-Updated": meta["last_updated"],
+            })
+        else:
+            _, body, _ = result
+
+        if _etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=body, media_type=media_type, headers=headers)
     except Exception as e:
         # Return empty filter if initialization fails
-        logger.warning(f"Bloom filter fetch failed: {e}")
+        logger.warning("Bloom filter fetch failed: %s", e)
         import base64
         import math
         empty_filter = base64.b64encode(bytearray(math.ceil(100000 / 8))).decode('utf-8')
@@ -0,0 +1,168 @@
+"""Batch API — runs several auth/profile/conversation sub-requests under one auth check.
+Registered in: main.py. Calls: auth.py and conversations.py route handlers directly (no HTTP hop).
+Called by: frontend flows that need several dependent calls at once (e.g. profile + username + conversations)."""
+
+import asyncio
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Literal, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, unquote
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field, ValidationError
+
+from app.api.dependencies.auth import get_current_user, TokenPayload
+from app.api.models.auth import PasswordValidationRequest, UsernameCheckRequest
+from app.api.routes import auth as auth_routes
+from app.api.routes import conversations as conversation_routes
+from app.services.bloom_filter_service import get_bloom_filter_data
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+MAX_SUB_REQUESTS = 20
+
+
+class SubRequest(BaseModel):
+    """Single request inside a batch envelope."""
+    id: str = Field(..., description="Client-chosen ID echoed back in the matching response")
+    method: Literal["GET", "POST"] = "GET"
+    url: str = Field(..., description="Route path, e.g. /auth/check-username/alice_01 or /conversations?limit=10")
+    body: Optional[Dict[str, Any]] = None
+
+
+class SubResponse(BaseModel):
+    """Result of a single sub-request."""
+    id: str
+    status: int
+    body: Any = None
+
+
+class BatchRequest(BaseModel):
+    """Batch envelope."""
+    requests: List[SubRequest] = Field(..., min_length=1, max_length=MAX_SUB_REQUESTS)
+
+
+class BatchResponse(BaseModel):
+    """Responses in the same order as the submitted sub-requests."""
+    responses: List[SubResponse]
+
+
+# Sub-request handler: (current_user, path + query params, body) -> route result
+Handler = Callable[[TokenPayload, Dict[str, str], Optional[dict]], Awaitable[Any]]
+
+NO_QUERY: FrozenSet[str] = frozenset()
+
+
+def _route(path: str) -> Pattern:
+    """Compile a route path with {param} placeholders into a full-match regex."""
+    return re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path) + "$")
+
+
+def _int_param(params: Dict[str, str], name: str, default: int) -> int:
+    """Read an integer query parameter, 422 if it is not one (as the route itself would)."""
+    value = params.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Query parameter '{name}' must be an integer",
+        )
+
+
+# Supported sub-requests (method, path, accepted query params, handler), dispatched straight
+# to the route functions
+BATCH_ROUTES: List[Tuple[str, Pattern, FrozenSet[str], Handler]] = [
+    ("GET", _route("/auth/me"), NO_QUERY,
+     lambda user, params, body: auth_routes.get_current_user_info(current_user=user)),
+    ("GET", _route("/auth/profile"), NO_QUERY,
+     lambda user, params, body: auth_routes.get_user_profile(current_user=user)),
+    ("GET", _route("/auth/check-username/{username}"), NO_QUERY,
+     lambda user, params, body: auth_routes.check_username_get(params["username"])),
+    ("POST", _route("/auth/check-username"), NO_QUERY,
+     lambda user, params, body: auth_routes.check_username_endpoint(UsernameCheckRequest(**(body or {})))),
+    ("POST", _route("/auth/validate-password"), NO_QUERY,
+     lambda user, params, body: auth_routes.validate_password_endpoint(PasswordValidationRequest(**(body or {})))),
+    ("GET", _route("/auth/generate-username"), NO_QUERY,
+     lambda user, params, body: auth_routes.generate_username_endpoint()),
+    ("GET", _route("/auth/bloom-filter"), NO_QUERY,
+     lambda user, params, body: asyncio.to_thread(get_bloom_filter_data)),
+    ("GET", _route("/conversations"), frozenset({"limit", "offset"}),
+     lambda user, params, body: conversation_routes.list_conversations(
+         current_user=user,
+         limit=_int_param(params, "limit", 50),
+         offset=_int_param(params, "offset", 0),
+     )),
+    ("GET", _route("/conversations/{conversation_id}"), NO_QUERY,
+     lambda user, params, body: conversation_routes.get_conversation(params["conversation_id"], current_user=user)),
+]
+
+
+async def _dispatch(sub: SubRequest, current_user: TokenPayload) -> SubResponse:
+    """Run one sub-request, mapping errors to per-item status codes instead of failing the batch."""
+    path, _, query = sub.url.partition("?")
+    path = path.rstrip("/") or "/"
+    # Last value wins for repeated keys, like a scalar query parameter on the route itself
+    query_params = dict(parse_qsl(query, keep_blank_values=True))
+
+    for method, pattern, accepted_query, handler in BATCH_ROUTES:
+        if method != sub.method:
+            continue
+        match = pattern.match(path)
+        if not match:
+            continue
+
+        # Reject query params the handler would ignore instead of answering as if they weren't sent
+        unsupported = query_params.keys() - accepted_query
+        if unsupported:
+            return SubResponse(
+                id=sub.id,
+                status=status.HTTP_400_BAD_REQUEST,
+                body={"detail": f"Unsupported query parameters for {sub.method} {path}: {', '.join(sorted(unsupported))}"},
+            )
+
+        # Percent-decode path params, as the router does for direct calls (e.g. foo%20bar);
+        # parse_qsl has already decoded the query params
+        params = {name: unquote(value) for name, value in match.groupdict().items()}
+        params.update(query_params)
+
+        try:
+            result = await handler(current_user, params, sub.body)
+            return SubResponse(id=sub.id, status=status.HTTP_200_OK, body=jsonable_encoder(result))
+        except HTTPException as e:
+            return SubResponse(id=sub.id, status=e.status_code, body={"detail": e.detail})
+        except ValidationError as e:
+            return SubResponse(
+                id=sub.id,
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                body={"detail": jsonable_encoder(e.errors())},
+            )
+        except Exception:
+            logger.exception("Batch sub-request %s %s failed", sub.method, sub.url)
+            return SubResponse(
+                id=sub.id,
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                body={"detail": "Sub-request failed"},
+            )
+
+    return SubResponse(
+        id=sub.id,
+        status=status.HTTP_404_NOT_FOUND,
+        body={"detail": f"Unsupported batch route: {sub.method} {sub.url}"},
+    )
+
+
+@router.post("", response_model=BatchResponse)
+async def batch_endpoint(
+    request: BatchRequest,
+    current_user: TokenPayload = Depends(get_current_user),
+) -> BatchResponse:
+    """Authenticate once, then run all sub-requests concurrently against the route handlers.
+    Called by: frontend when several auth/profile calls are needed together."""
+    responses = await asyncio.gather(*[_dispatch(sub, current_user) for sub in request.requests])
+    return BatchResponse(responses=list(responses))
@@ -2,14 +2,23 @@
 Registered in: main.py. Calls: llm_service, crawler_service, agents/graph.
 Called by: frontend useChat hook via /chat/stream, /chat/agentic-stream, /chat/suggest-mode."""
 
-import json
+import asyncio
+import itertools
 import logging
+import re
+import time
+import orjson
 from datetime import datetime, timezone
+from functools import lru_cache
+from urllib.parse import urlparse
 from fastapi import APIRouter, HTTPException, status, Depends
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from pydantic import BaseModel, Field
-from typing import Optional, Literal, List, AsyncGenerator, Dict
-from app.api.dependencies.auth import get_current_user, get_optional_user, TokenPayload
+from typing import Optional, Literal, List, AsyncGenerator, AsyncIterator, Callable
+from app.api.routing import ORJSONRoute
+from app.api.sse import SSE_HEADERS, SSE_PREFIX, SSE_SUFFIX, chunk_frame, content_frame
+from app.api.dependencies.auth import get_optional_user, TokenPayload
 
 logger = logging.getLogger(__name__)
 from app.config.settings import settings
@@ -19,13 +28,17 @@ from app.services.llm_service import (
     get_available_providers,
     get_llm,
     LLMProvider,
+    build_grounded_system_prompt,
+    to_langchain_history,
+    SEARCH_RESULTS_MARKERS,
+    WEB_SOURCES_MARKERS,
 )
 from app.api.models.crawler import (
-    CrawlerType,
-    Citation,
+    ChatMessage,
+    CHAT_HISTORY_ADAPTER,
+    CrawlerTypeName,
     CitationList,
     TriggerMode,
-    StreamChunk,
 )
 from app.services.crawler_service import (
     crawl_urls,
@@ -34,8 +47,85 @@ from app.services.crawler_service import (
     build_context_for_llm,
     agentic_search,
 )
+from app.services import conversation_service
+from app.services.cache import response_cache
+from app.services.agents.graph import get_agent_graph
+from app.services.agents.nodes.analyzer import analyze_query_node
+from app.services.agents.nodes.followup import generate_followup_questions
+from app.services.agents.validators import validate_response
 
-router = APIRouter(prefix="/chat", tags=["chat"])
+router = APIRouter(prefix="/chat", tags=["chat"], route_class=ORJSONRoute)
+
+
+_STREAM_END = object()
+
+
+async def _pump_stream(source: AsyncIterator[str], queue: asyncio.Queue) -> None:
+    """Drain an async iterator into a queue, ending with _STREAM_END (or the raised exception),
+    so a producer can run ahead of the SSE generator."""
+    try:
+        async for item in source:
+            queue.put_nowait(item)
+        queue.put_nowait(_STREAM_END)
+    except Exception as e:
+        queue.put_nowait(e)
+
+
+async def _coalesce_frames(
+    queue: asyncio.Queue,
+    encode: Callable[[str], bytes],
+) -> AsyncGenerator[bytes, None]:
+    """Encode queued text chunks into one bytearray, yielding it once it reaches
+    settings.sse_flush_bytes or settings.sse_flush_interval_ms has passed since its first frame,
+    so fast providers produce a few larger ASGI messages instead of one per token."""
+    loop = asyncio.get_running_loop()
+    flush_bytes = settings.sse_flush_bytes
+    flush_interval = settings.sse_flush_interval_ms / 1000
+    log_chunks = 3 if logger.isEnabledFor(logging.DEBUG) else 0  # first few chunks
+    buf = bytearray()
+    flush_at = 0.0
+
+    while True:
+        if buf:
+            timeout = flush_at - loop.time()
+            if timeout <= 0 or len(buf) >= flush_bytes:
+                yield bytes(buf)
+                buf.clear()
+                continue
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                continue
+        else:
+            item = await queue.get()
+            flush_at = loop.time() + flush_interval
+
+        if item is _STREAM_END:
+            break
+        if isinstance(item, Exception):
+            if buf:
+                yield bytes(buf)
+            raise item
+        if log_chunks:
+            log_chunks -= 1
+            logger.debug("LLM chunk: %.100s...", item or "empty")
+        buf += encode(item)
+
+    if buf:
+        yield bytes(buf)
+
+
+def _plain_frame(text: str) -> bytes:
+    """/chat/stream token frame without web search: raw text after the data: prefix."""
+    return SSE_PREFIX + text.encode() + SSE_SUFFIX
+
+
+# Constant /chat/stream frames, encoded once
+_SEARCHING_SSE = chunk_frame("status", status="searching")
+_GENERATING_SSE = chunk_frame("status", status="generating")
+_DONE_SSE = chunk_frame("done")
+_PLAIN_DONE_SSE = SSE_PREFIX + b"[DONE]" + SSE_SUFFIX
+_PLAIN_ERROR_PREFIX = SSE_PREFIX + b"[ERROR] "
 
 
 AGENTIC_SEARCH_PROMPT = """You are Nurav AI, an intelligent search assistant. You have access to web search results to answer user questions accurately.
@@ -103,12 +193,6 @@ IMPORTANT: Use [N] format with regular square brackets and the source number.
 The web sources are provided below. Use them to answer accurately with proper citations."""
 
 
-class ChatMessage(BaseModel):
-    """Single chat message."""
-    role: Literal["user", "assistant", "system"]
-    content: str
-
-
 class ChatRequest(BaseModel):
     """Chat request payload."""
     message: str = Field(..., min_length=1, max_length=10000)
@@ -119,7 +203,7 @@ class ChatRequest(BaseModel):
     # Web search options
     web_search_enabled: bool = Field(default=False, description="Enable agentic web search with citations")
     urls: Optional[List[str]] = Field(None, max_length=10, description="Explicit URLs to crawl")
-    crawler_type: CrawlerType = Field(default=CrawlerType.AUTO, description="auto, beautifulsoup, or playwright")
+    crawler_type: CrawlerTypeName = Field(default="auto", description="auto, beautifulsoup, or playwright")
     # Agentic mode options
     mode: Optional[Literal["simple", "research", "deep"]] = Field(None, description="Confirmed query mode")
     # Conversation persistence
@@ -154,21 +238,34 @@ async def chat_completions(
         trigger_mode = None
         search_query = None
         crawl_result = None
+        crawl_task = None
 
         # Mode 1: Explicit URLs provided
-        if request.urls and len(request.urls) > 0:
+        if request.urls:  # None or empty list means no explicit URLs
             trigger_mode = TriggerMode.EXPLICIT_URLS
-            crawl_result = await crawl_urls(request.urls, request.crawler_type)
+            crawl_task = asyncio.create_task(crawl_urls(request.urls, request.crawler_type))
 
         # Mode 2: Auto-search enabled
         elif request.web_search_enabled:
             trigger_mode = TriggerMode.AUTO_SEARCH
             search_query = request.message
-            crawl_result, _ = await search_and_crawl(
+            crawl_task = asyncio.create_task(search_and_crawl(
                 query=request.message,
                 max_results=5,
                 crawler_type=request.crawler_type,
-            )
+            ))
+
+        if crawl_task is not None:
+            # Let the crawl reach its first network wait before doing local work
+            await asyncio.sleep(0)
+
+        # Convert history while the crawl is in flight
+        history = to_langchain_history(request.chat_history)
+
+        if crawl_task is not None:
+            crawl_result = await crawl_task
+            if trigger_mode == TriggerMode.AUTO_SEARCH:
+                crawl_result, _ = crawl_result
 
         # Build context and citations if crawl was performed
         citations = None
@@ -176,7 +273,7 @@ async def chat_completions(
 
         if crawl_result and crawl_result.pages:
             citation_list = generate_citations(crawl_result.pages)
-            citations = CitationList(
+            citations = CitationList.model_construct(
                 citations=citation_list,
                 total_count=len(citation_list),
             )
@@ -185,16 +282,9 @@ async def chat_completions(
             context = build_context_for_llm(crawl_result.pages, citation_list)
 
             # Combine citation prompt with user's system prompt
-            base_prompt = CITATION_SYSTEM_PROMPT
-            if request.system_prompt:
-                base_prompt = f"{CITATION_SYSTEM_PROMPT}\n\nAdditional instructions: {request.system_prompt}"
-
-            system_prompt = f"{base_prompt}\n\n--- WEB SOURCES ---\n{context}\n--- END SOURCES ---"
-
-        # Convert chat history to dict format
-        history = None
-        if request.chat_history:
-            history = [{"role": msg.role, "content": msg.content} for msg in request.chat_history]
+            system_prompt = build_grounded_system_prompt(
+                CITATION_SYSTEM_PROMPT, context, request.system_prompt, WEB_SOURCES_MARKERS,
+            )
 
         response = await chat(
             message=request.message,
@@ -224,29 +314,35 @@ async def chat_completions(
         )
 
 
+# Fast path for absolute http(s) URLs; anything else falls back to urlparse
+_DOMAIN_RE = re.compile(r"^https?://(?:www\.)?([^/?#]+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
 def _extract_domain(url: str) -> str:
-    """Extract domain from URL for citations."""
+    """Extract domain from URL for citations. Memoized: called twice per search result
+    (context + citation) and popular domains repeat across queries."""
+    match = _DOMAIN_RE.match(url)
+    if match:
+        return match.group(1)
     try:
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        domain = parsed.netloc.replace("www.", "")
-        return domain
-    except:
+        netloc = urlparse(url).netloc
+    except Exception:
         return url
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+_SOURCE_TEMPLATE = "Source [{}]:\n- URL: {}\n- Domain: {}\n- Title: {}\n- Content: {}\n"
 
 
 def _build_search_context(search_results: List[dict]) -> str:
     """Build numbered source context string from search results for LLM."""
-    context_parts = []
+    fmt = _SOURCE_TEMPLATE.format
+    parts = []
     for i, result in enumerate(search_results, 1):
-        domain = _extract_domain(result.get("url", ""))
-        context_parts.append(f"""Source [{i}]:
-- URL: {result.get("url", "")}
-- Domain: {domain}
-- Title: {result.get("title", "")}
-- Content: {result.get("snippet", "")}
-""")
-    return "\n".join(context_parts)
+        url = result.get("url", "")
+        parts.append(fmt(i, url, _extract_domain(url), result.get("title", ""), result.get("snippet", "")))
+    return "\n".join(parts)
 
 
 @router.post("/stream")
@@ -256,129 +352,124 @@ async def chat_stream_endpoint(
 ):
     """SSE stream with agentic web search. Calls crawler_service.agentic_search for citations,
     streams LLM response via llm_service.chat_stream. Called by: frontend useChat (/chat/stream)."""
-    async def generate() -> AsyncGenerator[str, None]:
+    async def generate() -> AsyncGenerator[bytes, None]:
         web_mode = request.web_search_enabled
+        search_task = None
+        llm_task = None
         try:
             search_results = []
-            citations = []
             system_prompt = request.system_prompt
 
             # Agentic search phase
             if request.web_search_enabled:
-                # Send "searching" status
-                status_chunk = StreamChunk(type="status", status="searching")
-                yield f"data: {status_chunk.model_dump_json()}\n\n"
-
-                logger.info(f"Agentic search for: {request.message}")
-                search_results = await agentic_search(
+                logger.debug("Agentic search for: %s", request.message)
+                search_task = asyncio.create_task(agentic_search(
                     query=request.message,
                     max_results=20,  # Get top 20 results
-                )
-                logger.info(f"Search returned {len(search_results)} results")
-
-                # Generate citations from search results with favicon URLs
-                for i, result in enumerate(search_results, 1):
-                    domain = _extract_domain(result.get("url", ""))
-                    favicon_url = f"https://www.google.com/s2/favicons?domain={domain}&sz=32" if domain else None
-                    citation = Citation(
-                        id=i,
-                        url=result.get("url", ""),
-                        root_url=f"https://{domain}",
-                        title=result.get("title", ""),
-                        snippet=result.get("snippet", ""),
-                        favicon_url=favicon_url,
-                    )
-                    citations.append(citation)
+                ))
+                # Send "searching" status; the search starts while this frame is flushed
+                yield _SEARCHING_SSE
 
-                    # Send citation event
-                    chunk = StreamChunk(type="citation", citation=citation)
-                    yield f"data: {chunk.model_dump_json()}\n\n"
+            # Convert history while the search is in flight
+            history = to_langchain_history(request.chat_history)
 
-                logger.info(f"Sent {len(citations)} citations")
+            if search_task is not None:
+                search_results = await search_task
+                logger.debug("Search returned %d results", len(search_results))
 
                 # Build context for LLM from search snippets
                 context = _build_search_context(search_results)
-                base_prompt = AGENTIC_SEARCH_PROMPT
-                if request.system_prompt:
-                    base_prompt = f"{AGENTIC_SEARCH_PROMPT}\n\nAdditional instructions: {request.system_prompt}"
-                system_prompt = f"{base_prompt}\n\n--- SEARCH RESULTS ---\n{context}\n--- END SEARCH RESULTS ---"
-
-            # Convert chat history
-            history = None
-            if request.chat_history:
-                history = [
-                    {"role": msg.role, "content": msg.content}
-                    for msg in request.chat_history
-                ]
+                system_prompt = build_grounded_system_prompt(
+                    AGENTIC_SEARCH_PROMPT, context, request.system_prompt, SEARCH_RESULTS_MARKERS,
+                )
+
+            # Kick off the LLM request now, so the provider round-trip overlaps citation emission
+            logger.debug("Starting LLM stream with provider: %s", request.provider)
+            llm_chunks: asyncio.Queue = asyncio.Queue()
+            llm_task = asyncio.create_task(_pump_stream(
+                chat_stream(
+                    message=request.message,
+                    provider=request.provider,
+                    chat_history=history,
+                    system_prompt=system_prompt,
+                ),
+                llm_chunks,
+            ))
 
-            # Send "generating" status before LLM streaming starts
             if web_mode:
-                status_chunk = StreamChunk(type="status", status="generating")
-                yield f"data: {status_chunk.model_dump_json()}\n\n"
-
-            # Stream LLM response
-            logger.info(f"Starting LLM stream with provider: {request.provider}")
-            chunk_count = 0
-            async for text_chunk in chat_stream(
-                message=request.message,
-                provider=request.provider,
-                chat_history=history,
-                system_prompt=system_prompt,
-            ):
-                chunk_count += 1
-                if chunk_count <= 3:  # Log first few chunks for debugging
-                    logger.info(f"LLM chunk {chunk_count}: {text_chunk[:100] if text_chunk else 'empty'}...")
-                # Use StreamChunk format if web search was used, otherwise plain text
-                if web_mode:
-                    chunk = StreamChunk(type="content", content=text_chunk)
-                    yield f"data: {chunk.model_dump_json()}\n\n"
-                else:
-                    yield f"data: {text_chunk}\n\n"
-            logger.info(f"LLM stream completed with {chunk_count} chunks")
+                # Generate citations from search results with favicon URLs. Citation-shaped dicts
+                # go straight to orjson; same JSON as Citation.model_dump(mode="json")
+                crawled_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+                frames = []
+                for i, result in enumerate(search_results, 1):
+                    url = result.get("url", "")
+                    domain = _extract_domain(url)
+                    frames.append(chunk_frame("citation", citation={
+                        "id": i,
+                        "url": url,
+                        "root_url": f"https://{domain}",
+                        "title": result.get("title", ""),
+                        "snippet": result.get("snippet", ""),
+                        "favicon_url": f"https://www.google.com/s2/favicons?domain={domain}&sz=32" if domain else None,
+                        "crawled_at": crawled_at,
+                        "crawler_type": "auto",
+                    }))
+
+                # All citation events plus the "generating" status go out as one body chunk
+                frames.append(_GENERATING_SSE)
+                yield b"".join(frames)
+                logger.debug("Sent %d citations", len(search_results))
+
+            # Stream LLM response: StreamChunk format if web search was used, otherwise plain
+            # text. The encoder is picked once so the token loop has no per-chunk branch.
+            encode = content_frame if web_mode else _plain_frame
+            async for body in _coalesce_frames(llm_chunks, encode):
+                yield body
+            logger.debug("LLM stream completed")
 
             # Signal completion
-            if web_mode:
-                done_chunk = StreamChunk(type="done")
-                yield f"data: {done_chunk.model_dump_json()}\n\n"
-            else:
-                yield "data: [DONE]\n\n"
+            yield _DONE_SSE if web_mode else _PLAIN_DONE_SSE
 
         except Exception as e:
-            import traceback
-            logger.error(f"Stream error: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("Stream error: %s", e)
             if web_mode:
-                error_chunk = StreamChunk(type="error", error=str(e))
-                yield f"data: {error_chunk.model_dump_json()}\n\n"
+                yield chunk_frame("error", error=str(e))
             else:
-                yield f"data: [ERROR] {str(e)}\n\n"
+                yield _PLAIN_ERROR_PREFIX + str(e).encode() + SSE_SUFFIX
+        finally:
+            # Client disconnected or stream failed: stop the search and LLM requests
+            for task in (search_task, llm_task):
+                if task is not None and not task.done():
+                    task.cancel()
 
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=SSE_HEADERS,
     )
 
 
-@router.get("/providers", response_model=ProvidersResponse)
-async def list_providers():
-    """Return configured LLM providers and models from llm_service. Called by: frontend provider selector."""
+@lru_cache(maxsize=1)
+def _providers_body() -> bytes:
+    """Encoded ProvidersResponse. Providers only depend on settings, so this is built once."""
     providers = get_available_providers()
 
     if not providers:
-        return ProvidersResponse(providers=[{
+        providers = [{
             "id": "google",
             "name": "Google Gemini",
             "model": "gemini-1.5-pro",
             "available": False,
             "message": "No API keys configured",
-        }])
+        }]
+
+    return orjson.dumps(ProvidersResponse(providers=providers).model_dump(mode="json"))
+
 
-    return ProvidersResponse(providers=providers)
+@router.get("/providers", response_model=ProvidersResponse)
+async def list_providers() -> Response:
+    """Return configured LLM providers and models from llm_service. Called by: frontend provider selector."""
+    return Response(content=_providers_body(), media_type="application/json")
 
 
 class ModeSuggestionResponse(BaseModel):
@@ -398,8 +489,6 @@ async def suggest_query_mode(
     """Analyze query complexity via agents/analyzer node. Returns suggested mode (simple/research/deep)
     with reasoning. Called by: frontend useChat.suggestMode before sending."""
     try:
-        from app.services.agents.nodes.analyzer import analyze_query_node
-
         state = {
             "query": request.message,
             "messages": [],
@@ -453,13 +542,8 @@ async def agentic_chat_stream(
     """Full agentic workflow SSE stream. Runs LangGraph: analyzer -> searcher -> retriever -> synthesizer.
     Streams phase updates, citations, and LLM tokens. Saves to conversation_service if authenticated.
     Called by: frontend useChat (/chat/agentic-stream)."""
-    async def generate() -> AsyncGenerator[str, None]:
+    async def generate() -> AsyncGenerator[bytes, None]:
         try:
-            import time
-            from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-            from app.services.agents.graph import get_agent_graph
-            from app.services.cache import response_cache
-
             graph = get_agent_graph()
             start_time = time.monotonic()
             query_mode = request.mode or "simple"
@@ -467,16 +551,16 @@ async def agentic_chat_stream(
             # Check cache first
             cached = response_cache.get(request.message, query_mode)
             if cached:
-                yield _sse_event("status", {"status": "cached"})
-                # Stream cached citations
-                for citation in cached.get("citations", []):
-                    yield _sse_event("citation", {"citation": citation})
-                # Stream cached response in chunks for progressive rendering
-                cached_response = cached["response"]
-                chunk_size = 80
-                for i in range(0, len(cached_response), chunk_size):
-                    yield _sse_event("content", {"content": cached_response[i:i + chunk_size]})
-                yield _sse_event("done", {})
+                # Replay the cached answer in one write: citations, then the whole response as a
+                # single content event (the client appends content events, so no re-chunking)
+                frames = [_AGENTIC_CACHED_SSE]
+                frames.extend(
+                    _sse_event("citation", {"citation": citation})
+                    for citation in cached.get("citations", [])
+                )
+                frames.append(_content_event(cached["response"]))
+                frames.append(_AGENTIC_DONE_SSE)
+                yield b"".join(frames)
                 return
 
             # Build initial state
@@ -495,20 +579,17 @@ async def agentic_chat_stream(
                 "synthesis_messages": None,
                 "current_phase": "analyzing",
                 "provider": request.provider or settings.synthesizer_provider,
-                "chat_history": [
-                    {"role": msg.role, "content": msg.content}
-                    for msg in (request.chat_history or [])
-                ],
+                "chat_history": CHAT_HISTORY_ADAPTER.dump_python(request.chat_history or []),
                 "system_prompt": request.system_prompt,
                 "start_time": datetime.now(timezone.utc).isoformat(),
                 "errors": [],
             }
 
             # Send initial status
-            yield _sse_event("status", {"status": "analyzing"})
+            yield _AGENTIC_ANALYZING_SSE
 
             # Stream through the graph (analysis -> search -> RAG -> prepare_synthesis)
-            config = {"configurable": {"thread_id": f"agentic_{datetime.now(timezone.utc).timestamp()}"}}
+            config = {"configurable": {"thread_id": f"agentic_{time.monotonic_ns()}_{next(_agentic_thread_seq)}"}}
             prev_phase = "analyzing"
             citations_sent = set()
             final_state = {}
@@ -524,14 +605,8 @@ async def agentic_chat_stream(
                     # Send phase updates
                     phase = node_output.get("current_phase", "")
                     if phase and phase != prev_phase:
-                        phase_labels = {
-                            "analyzed": "searching",
-                            "searched": "retrieving",
-                            "retrieved": "synthesizing",
-                            "synthesized": "generating",
-                        }
-                        display_phase = phase_labels.get(phase, phase)
-                        yield _sse_event("status", {"status": display_phase})
+                        frame = _AGENTIC_PHASE_SSE.get(phase)
+                        yield frame if frame is not None else _sse_event("status", {"status": phase})
                         prev_phase = phase
 
                     # Send mode detection result
@@ -542,30 +617,33 @@ async def agentic_chat_stream(
                             "sources": node_output.get("requires_sources", []),
                         })
 
-                    # Send citations as they're discovered
-                    citations = node_output.get("citations", [])
-                    for citation in citations:
+                    # Send citations as they're discovered. Nodes re-emit accumulated citations,
+                    # so new IDs are detected by set growth (one hash lookup per citation).
+                    # A node's new citations go out in one write.
+                    citation_frames = []
+                    for citation in node_output.get("citations", ()):
                         cit_id = citation.get("id")
-                        if cit_id and cit_id not in citations_sent:
-                            citations_sent.add(cit_id)
-                            yield _sse_event("citation", {"citation": citation})
+                        if not cit_id:
+                            continue
+                        sent_count = len(citations_sent)
+                        citations_sent.add(cit_id)
+                        if len(citations_sent) != sent_count:
+                            citation_frames.append(_sse_event("citation", {"citation": citation}))
+                    if citation_frames:
+                        yield b"".join(citation_frames)
 
             # Real token-by-token LLM streaming using prepared synthesis messages
             synthesis_messages = final_state.get("synthesis_messages")
             if synthesis_messages:
-                yield _sse_event("status", {"status": "generating"})
-
-                # Convert dict messages to LangChain message objects
-                lc_messages = []
-                for msg in synthesis_messages:
-                    role = msg.get("role", "")
-                    content = msg.get("content", "")
-                    if role == "system":
-                        lc_messages.append(SystemMessage(content=content))
-                    elif role == "user":
-                        lc_messages.append(HumanMessage(content=content))
-                    elif role == "assistant":
-                        lc_messages.append(AIMessage(content=content))
+                yield _AGENTIC_GENERATING_SSE
+
+                # Convert dict messages to LangChain message objects in one pass
+                message_types = {"system": SystemMessage, "user": HumanMessage, "assistant": AIMessage}
+                lc_messages = [
+                    message_types[msg["role"]](content=msg.get("content", ""))
+                    for msg in synthesis_messages
+                    if msg.get("role") in message_types
+                ]
 
                 # Stream from LLM token-by-token
                 llm = get_llm(
@@ -573,12 +651,14 @@ async def agentic_chat_stream(
                     streaming=True,
                     model_override=settings.synthesizer_model,
                 )
-                full_response = ""
+                # Tokens are sent as deltas and collected once for the cache and saved message
+                tokens = []
                 async for chunk in llm.astream(lc_messages):
                     token = chunk.content if hasattr(chunk, "content") else str(chunk)
                     if token:
-                        full_response += token
-                        yield _sse_event("content", {"content": token})
+                        tokens.append(token)
+                        yield _content_event(token)
+                full_response = "".join(tokens)
 
                 # Store response in cache and final state
                 final_state["synthesized_response"] = full_response
@@ -593,12 +673,11 @@ async def agentic_chat_stream(
                 logger.warning("No synthesis messages in final state")
 
             elapsed = time.monotonic() - start_time
-            logger.info(f"Agentic stream completed in {elapsed:.2f}s")
+            logger.info("Agentic stream completed in %.2fs", elapsed)
 
             # Auto-save messages to conversation if user is authenticated
             if current_user and request.conversation_id and final_state.get("synthesized_response"):
                 try:
-                    from app.services import conversation_service
                     await conversation_service.add_messages(
                         conversation_id=request.conversation_id,
                         user_id=current_user.sub,
@@ -612,22 +691,19 @@ async def agentic_chat_stream(
                         ],
                     )
                 except Exception as save_err:
-                    logger.warning(f"Failed to save messages: {save_err}")
+                    logger.warning("Failed to save messages: %s", save_err)
 
             # Run quality validation in background (non-blocking, log only)
             if final_state.get("synthesized_response"):
                 try:
-                    from app.services.agents.validators import validate_response
                     # Fire-and-forget: don't await, just log result
-                    import asyncio
                     asyncio.create_task(validate_response(request.message, final_state["synthesized_response"]))
                 except Exception as val_err:
-                    logger.debug(f"Validation setup failed: {val_err}")
+                    logger.debug("Validation setup failed: %s", val_err)
 
             # Generate follow-up questions (non-blocking, skip on failure)
             if final_state.get("synthesized_response"):
                 try:
-                    from app.services.agents.nodes.followup import generate_followup_questions
                     followups = await generate_followup_questions(
                         request.message,
                         final_state["synthesized_response"],
@@ -635,29 +711,53 @@ async def agentic_chat_stream(
                     if followups:
                         yield _sse_event("followup", {"questions": followups})
                 except Exception as followup_err:
-                    logger.warning(f"Follow-up generation failed: {followup_err}")
+                    logger.warning("Follow-up generation failed: %s", followup_err)
 
             # Signal completion
-            yield _sse_event("done", {})
+            yield _AGENTIC_DONE_SSE
 
         except Exception as e:
-            import traceback
-            logger.error(f"Agentic stream error: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception("Agentic stream error: %s", e)
             yield _sse_event("error", {"error": str(e)})
 
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=SSE_HEADERS,
     )
 
 
-def _sse_event(event_type: str, data: dict) -> str:
-    """Format a Server-Sent Event with type field."""
-    payload = {"type": event_type, **data}
-    return f"data: {json.dumps(payload)}\n\n"
+def _sse_event(event_type: str, data: dict) -> bytes:
+    """Format a Server-Sent Event with type field, encoded with orjson."""
+    return SSE_PREFIX + orjson.dumps({"type": event_type, **data}) + SSE_SUFFIX
+
+
+# Per-process sequence making agentic checkpointer thread IDs unique under concurrent requests
+_agentic_thread_seq = itertools.count()
+
+_AGENTIC_CONTENT_HEAD = SSE_PREFIX + b'{"type":"content","content":'
+_AGENTIC_CONTENT_TAIL = b"}" + SSE_SUFFIX
+
+
+def _content_event(text: str) -> bytes:
+    """Agentic content event around a pre-encoded prefix; same bytes as
+    _sse_event("content", {"content": text}) without a dict merge per token."""
+    return b"".join((_AGENTIC_CONTENT_HEAD, orjson.dumps(text), _AGENTIC_CONTENT_TAIL))
+
+
+# Constant /chat/agentic-stream frames, encoded once
+_AGENTIC_CACHED_SSE = _sse_event("status", {"status": "cached"})
+_AGENTIC_ANALYZING_SSE = _sse_event("status", {"status": "analyzing"})
+_AGENTIC_GENERATING_SSE = _sse_event("status", {"status": "generating"})
+_AGENTIC_DONE_SSE = _sse_event("done", {})
+
+# Graph node phase -> status frame for the step that follows it, encoded once
+_AGENTIC_PHASE_SSE = {
+    phase: _sse_event("status", {"status": label})
+    for phase, label in (
+        ("analyzed", "searching"),
+        ("searched", "retrieving"),
+        ("retrieved", "synthesizing"),
+        ("synthesized", "generating"),
+    )
+}
@@ -2,10 +2,14 @@
 Registered in: main.py. Calls: crawler_service (crawl/search), llm_service (chat/stream).
 Called by: frontend as alternative web-augmented chat endpoints."""
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import StreamingResponse
 from typing import Optional, AsyncGenerator
 
+from app.api.routing import ORJSONRoute
+from app.api.sse import SSE_HEADERS, chunk_frame, content_frame
 from app.api.dependencies.auth import get_optional_user, TokenPayload
 from app.api.models.crawler import (
     CrawlRequest,
@@ -15,7 +19,7 @@ from app.api.models.crawler import (
     WebChatResponse,
     CitationList,
     TriggerMode,
-    StreamChunk,
+    CITATIONS_ADAPTER,
 )
 from app.services.crawler_service import (
     crawl_urls,
@@ -23,9 +27,13 @@ from app.services.crawler_service import (
     generate_citations,
     build_context_for_llm,
 )
-from app.services.llm_service import chat, chat_stream
+from app.services.llm_service import chat, chat_stream, build_grounded_system_prompt, to_langchain_history
+
+router = APIRouter(prefix="/crawler", tags=["crawler"], route_class=ORJSONRoute)
 
-router = APIRouter(prefix="/crawler", tags=["crawler"])
+# Constant stream frames, encoded once
+_READING_SSE = chunk_frame("status", status="reading")
+_DONE_SSE = chunk_frame("done")
 
 
 CITATION_SYSTEM_PROMPT = """You are Nurav AI, a helpful assistant with access to web search results.
@@ -56,7 +64,7 @@ async def crawl_endpoint(
             urls=request.urls,
             crawler_type=request.crawler_type,
         )
-        return CrawlResponse(success=True, result=result)
+        return CrawlResponse.model_construct(success=True, result=result, error=None)
 
     except Exception as e:
         raise HTTPException(
@@ -79,7 +87,7 @@ async def search_and_crawl_endpoint(
             crawler_type=request.crawler_type,
             search_engine=request.search_engine,
         )
-        return CrawlResponse(success=True, result=result)
+        return CrawlResponse.model_construct(success=True, result=result, error=None)
 
     except Exception as e:
         raise HTTPException(
@@ -99,21 +107,34 @@ async def web_chat_endpoint(
         trigger_mode = None
         search_query = None
         crawl_result = None
+        crawl_task = None
 
         # Mode 1: Explicit URLs provided
-        if request.urls and len(request.urls) > 0:
+        if request.urls:  # None or empty list means no explicit URLs
             trigger_mode = TriggerMode.EXPLICIT_URLS
-            crawl_result = await crawl_urls(request.urls, request.crawler_type)
+            crawl_task = asyncio.create_task(crawl_urls(request.urls, request.crawler_type))
 
         # Mode 2: Auto-search enabled
         elif request.web_search_enabled:
             trigger_mode = TriggerMode.AUTO_SEARCH
             search_query = request.message  # Use message as search query
-            crawl_result, _ = await search_and_crawl(
+            crawl_task = asyncio.create_task(search_and_crawl(
                 query=request.message,
                 max_results=5,
                 crawler_type=request.crawler_type,
-            )
+            ))
+
+        if crawl_task is not None:
+            # Let the crawl reach its first network wait before doing local work
+            await asyncio.sleep(0)
+
+        # Convert history while the crawl is in flight
+        history = to_langchain_history(request.chat_history)
+
+        if crawl_task is not None:
+            crawl_result = await crawl_task
+            if trigger_mode == TriggerMode.AUTO_SEARCH:
+                crawl_result, _ = crawl_result
 
         # Build context and citations if crawl was performed
         citations = CitationList()
@@ -121,7 +142,7 @@ async def web_chat_endpoint(
 
         if crawl_result and crawl_result.pages:
             citation_list = generate_citations(crawl_result.pages)
-            citations = CitationList(
+            citations = CitationList.model_construct(
                 citations=citation_list,
                 total_count=len(citation_list),
             )
@@ -130,19 +151,7 @@ async def web_chat_endpoint(
             context = build_context_for_llm(crawl_result.pages, citation_list)
 
             # Combine citation prompt with user's system prompt
-            base_prompt = CITATION_SYSTEM_PROMPT
-            if request.system_prompt:
-                base_prompt = f"{CITATION_SYSTEM_PROMPT}\n\nAdditional instructions: {request.system_prompt}"
-
-            system_prompt = f"{base_prompt}\n\n--- WEB SOURCES ---\n{context}\n--- END SOURCES ---"
-
-        # Convert chat history to dict format
-        history = None
-        if request.chat_history:
-            history = [
-                {"role": msg.role, "content": msg.content}
-                for msg in request.chat_history
-            ]
+            system_prompt = build_grounded_system_prompt(CITATION_SYSTEM_PROMPT, context, request.system_prompt)
 
         # Call LLM
         response = await chat(
@@ -180,22 +189,33 @@ async def web_chat_stream_endpoint(
 ):
     """SSE streaming version of web_chat_endpoint. Sends citations first, then streams
     LLM response via llm_service.chat_stream. Called by: frontend for streaming web chat."""
-    async def generate() -> AsyncGenerator[str, None]:
+    async def generate() -> AsyncGenerator[bytes, None]:
+        crawl_task = None
         try:
             trigger_mode = None
             crawl_result = None
 
-            # Crawl phase
-            if request.urls and len(request.urls) > 0:
+            # Crawl phase: the crawl starts while the "reading" frame is flushed
+            if request.urls:  # None or empty list means no explicit URLs
                 trigger_mode = TriggerMode.EXPLICIT_URLS
-                crawl_result = await crawl_urls(request.urls, request.crawler_type)
+                crawl_task = asyncio.create_task(crawl_urls(request.urls, request.crawler_type))
+                yield _READING_SSE
             elif request.web_search_enabled:
                 trigger_mode = TriggerMode.AUTO_SEARCH
-                crawl_result, _ = await search_and_crawl(
+                crawl_task = asyncio.create_task(search_and_crawl(
                     query=request.message,
                     max_results=5,
                     crawler_type=request.crawler_type,
-                )
+                ))
+                yield _READING_SSE
+
+            # Convert history while the crawl is in flight
+            history = to_langchain_history(request.chat_history)
+
+            if crawl_task is not None:
+                crawl_result = await crawl_task
+                if trigger_mode == TriggerMode.AUTO_SEARCH:
+                    crawl_result, _ = crawl_result
 
             # Send citations first
             citations = []
@@ -204,25 +224,19 @@ async def web_chat_stream_endpoint(
             if crawl_result and crawl_result.pages:
                 citations = generate_citations(crawl_result.pages)
 
-                # Send each citation as SSE event
-                for citation in citations:
-                    chunk = StreamChunk(type="citation", citation=citation)
-                    yield f"data: {chunk.model_dump_json()}\n\n"
-
-                # Build context for LLM
-                context = build_context_for_llm(crawl_result.pages, citations)
-                base_prompt = CITATION_SYSTEM_PROMPT
-                if request.system_prompt:
-                    base_prompt = f"{CITATION_SYSTEM_PROMPT}\n\nAdditional instructions: {request.system_prompt}"
-                system_prompt = f"{base_prompt}\n\n--- WEB SOURCES ---\n{context}\n--- END SOURCES ---"
-
-            # Convert chat history
-            history = None
-            if request.chat_history:
-                history = [
-                    {"role": msg.role, "content": msg.content}
-                    for msg in request.chat_history
-                ]
+                # Build context for LLM off the event loop while the citations are sent
+                context_task = asyncio.create_task(
+                    asyncio.to_thread(build_context_for_llm, crawl_result.pages, citations)
+                )
+
+                # Send every citation event in one write (one frame per citation on the wire)
+                yield b"".join(
+                    chunk_frame("citation", citation=citation)
+                    for citation in CITATIONS_ADAPTER.dump_python(citations, mode="json")
+                )
+
+                context = await context_task
+                system_prompt = build_grounded_system_prompt(CITATION_SYSTEM_PROMPT, context, request.system_prompt)
 
             # Stream LLM response
             async for text_chunk in chat_stream(
@@ -231,23 +245,20 @@ async def web_chat_stream_endpoint(
                 chat_history=history,
                 system_prompt=system_prompt,
             ):
-                chunk = StreamChunk(type="content", content=text_chunk)
-                yield f"data: {chunk.model_dump_json()}\n\n"
+                yield content_frame(text_chunk)
 
             # Signal completion
-            done_chunk = StreamChunk(type="done")
-            yield f"data: {done_chunk.model_dump_json()}\n\n"
+            yield _DONE_SSE
 
         except Exception as e:
-            error_chunk = StreamChunk(type="error", error=str(e))
-            yield f"data: {error_chunk.model_dump_json()}\n\n"
+            yield chunk_frame("error", error=str(e))
+        finally:
+            # Client disconnected or stream failed: stop the crawl
+            if crawl_task is not None and not crawl_task.done():
+                crawl_task.cancel()
 
     return StreamingResponse(
         generate(),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=SSE_HEADERS,
     )
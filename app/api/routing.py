@@ -0,0 +1,35 @@
+"""Custom route class that parses JSON request bodies with orjson.
+Used by: chat.py and crawler.py routers (large chat payloads with history),
+auth.py router (small but very frequent signin/OTP bodies)."""
+
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+try:
+    import orjson
+except ImportError:
+    raise ImportError("orjson not installed. Install with: pip install orjson")
+
+
+class ORJSONRequest(Request):
+    """Request whose json() decodes the body with orjson instead of stdlib json."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that hands handlers an ORJSONRequest, so body parsing goes through orjson."""
+
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            return await original_route_handler(request)
+
+        return custom_route_handler
@@ -0,0 +1,55 @@
+"""Server-sent event frame encoding and response headers shared by the streaming chat endpoints.
+Used by: chat.py (/chat/stream) and crawler.py (/crawler/chat/stream)."""
+
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    raise ImportError("orjson not installed. Install with: pip install orjson")
+
+
+# SSE envelope, pre-encoded: frames are built as SSE_PREFIX + payload + SSE_SUFFIX
+SSE_PREFIX = b"data: "
+SSE_SUFFIX = b"\n\n"
+
+# StreamingResponse headers for SSE. Frames must reach the client as they are yielded:
+# X-Accel-Buffering turns off nginx proxy buffering, no-transform and the explicit identity
+# Content-Encoding keep proxies and gzip middleware (which buffer to compress) off the stream.
+# Reverse proxies in front of these routes should also set proxy_buffering off and gzip off.
+SSE_HEADERS = {
+    "Cache-Control": "no-cache, no-transform",
+    "Connection": "keep-alive",
+    "Content-Encoding": "identity",
+    "X-Accel-Buffering": "no",
+}
+
+
+def chunk_frame(
+    chunk_type: str,
+    content: Optional[str] = None,
+    citation: Optional[dict] = None,
+    status: Optional[str] = None,
+    error: Optional[str] = None,
+) -> bytes:
+    """Encode a StreamChunk-shaped SSE frame with orjson. Same keys and order as
+    StreamChunk.model_dump_json(), without building a model per token."""
+    return SSE_PREFIX + orjson.dumps({
+        "type": chunk_type,
+        "content": content,
+        "citation": citation,
+        "status": status,
+        "error": error,
+    }) + SSE_SUFFIX
+
+
+# Fixed parts of a content frame around the JSON-encoded text; same bytes as
+# chunk_frame("content", content=text)
+_CONTENT_FRAME_HEAD = SSE_PREFIX + b'{"type":"content","content":'
+_CONTENT_FRAME_TAIL = b',"citation":null,"status":null,"error":null}' + SSE_SUFFIX
+
+
+def content_frame(text: str) -> bytes:
+    """Encode a StreamChunk type="content" frame. Only the token text goes through orjson, so
+    the per-token cost is one string encode instead of building and serializing a dict."""
+    return b"".join((_CONTENT_FRAME_HEAD, orjson.dumps(text), _CONTENT_FRAME_TAIL))
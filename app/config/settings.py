@@ -1,5 +1,11 @@
+from functools import cached_property
+from types import MappingProxyType
+from typing import Mapping, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional
+
+# Returned by get_llm_config for unknown providers
+_EMPTY_CONFIG: Mapping[str, object] = MappingProxyType({})
 
 
 class Settings(BaseSettings):
@@ -40,12 +46,16 @@ class Settings(BaseSettings):
 
     # Rate Limiting
     rate_limit_per_minute: int = 60
+    # Reverse proxies whose X-Forwarded-For is trusted for the client IP: comma-separated
+    # IPs/CIDRs, or "*" for any peer. Empty means the direct peer address is the client.
+    trusted_proxy_ips: str = ""
 
     # Supabase Configuration
     supabase_url: Optional[str] = None
     supabase_key: Optional[str] = None  # anon key for client operations
     supabase_service_role_key: Optional[str] = None  # service role key for DB operations (bypasses RLS)
-    jwt_secret: Optional[str] = None
+    jwt_secret: Optional[str] = None  # password pepper (app/services/password_service.py)
+    supabase_jwt_secret: Optional[str] = None  # project JWT secret, verifies HS256 access tokens locally
 
     # Frontend Configuration
     frontend_url: str = "http://localhost:3000"
@@ -62,6 +72,10 @@ class Settings(BaseSettings):
     default_search_engine: str = "duckduckgo"
     search_max_results: int = 5
 
+    # SSE Streaming: token frames are coalesced until either threshold is hit (0 ms = per token)
+    sse_flush_bytes: int = 4096
+    sse_flush_interval_ms: int = 50
+
     # Playwright Configuration
     playwright_headless: bool = True
     playwright_browser: str = "chromium"
@@ -85,8 +99,9 @@ class Settings(BaseSettings):
     query_timeout_research: int = 15
     query_timeout_deep: int = 30
 
-    def get_llm_config(self, provider: str) -> dict:
-        """Get configuration for a specific LLM provider."""
+    @cached_property
+    def llm_configs(self) -> Mapping[str, Mapping[str, object]]:
+        """Per-provider LLM configuration, built once per settings instance (read-only)."""
         configs = {
             "openai": {
                 "api_key": self.openai_api_key,
@@ -107,7 +122,11 @@ class Settings(BaseSettings):
                 "max_tokens": self.google_max_tokens,
             }
         }
-        return configs.get(provider, {})
+        return MappingProxyType({name: MappingProxyType(config) for name, config in configs.items()})
+
+    def get_llm_config(self, provider: str) -> Mapping[str, object]:
+        """Get configuration for a specific LLM provider."""
+        return self.llm_configs.get(provider, _EMPTY_CONFIG)
 
 
 # Global settings instance
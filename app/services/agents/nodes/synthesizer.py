@@ -2,6 +2,7 @@
 LLM streaming happens in the endpoint after graph completion for true token-by-token streaming."""
 
 import logging
+from functools import lru_cache
 from typing import List, Dict, Optional
 from urllib.parse import urlparse
 from app.services.agents.state import AgentState, SourceResult, CitationEntry
@@ -124,11 +125,8 @@ async def prepare_synthesis_node(state: AgentState) -> dict:
     messages = [{"role": "system", "content": full_system}]  # plain dicts, not LangChain objects
 
     if chat_history:
-        for msg in chat_history:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-            if role in ("user", "assistant"):
-                messages.append({"role": role, "content": content})
+        # History arrives as role/content dicts dumped by the endpoint; reuse them as-is
+        messages.extend(msg for msg in chat_history if msg.get("role") in ("user", "assistant"))
 
     messages.append({"role": "user", "content": query})
 
@@ -142,11 +140,11 @@ async def prepare_synthesis_node(state: AgentState) -> dict:
     }
 
 
+@lru_cache(maxsize=4096)
 def _extract_domain(url: str) -> str:
-    """Extract clean domain from URL."""
+    """Extract clean domain from URL. Memoized: called for every source and citation."""
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.replace("www.", "")
-        return domain or url
+        netloc = urlparse(url).netloc
     except Exception:
         return url
+    return (netloc[4:] if netloc.startswith("www.") else netloc) or url
@@ -1,22 +1,18 @@
 """Bloom filter for fast probabilistic username availability checking.
 Called by: auth routes (signup, check_username, generate_username, bloom_filter endpoint)."""
+import asyncio
 import hashlib
 import logging
 import math
 import base64
 import random
-import string
 from datetime import datetime, timezone
 from typing import List, Optional, Tuple
-from app.config.settings import settings
+import orjson
+from app.services.user_service import get_supabase_admin_client
 
 logger = logging.getLogger(__name__)
 
-try:
-    from supabase import create_client
-except ImportError:
-    raise ImportError("Supabase not installed")
-
 
 # Bloom filter configuration
 BLOOM_FILTER_SIZE = 100000  # 100k bits (~12.5KB)
@@ -104,54 +100,35 @@ class BloomFilter:
 _username_bloom_filter: Optional[BloomFilter] = None
 _last_refresh: Optional[datetime] = None
 REFRESH_INTERVAL_SECONDS = 300  # Refresh every 5 minutes
-
-
-def get_supabase_client():
-    """Get Supabase client with anon key."""
-    if not settings.supabase_url or not settings.supabase_key:
-        raise ValueError("Supabase not configured")
-    return create_client(settings.supabase_url, settings.supabase_key)
-
-
-def get_supabase_admin_client():
-    """Get Supabase client with service role key (bypasses RLS)."""
-    if not settings.supabase_url:
-        raise ValueError("Supabase URL not configured")
-
-    # Prefer service role key for DB operations, fall back to anon key
-    key = settings.supabase_service_role_key or settings.supabase_key
-    if not key:
-        raise ValueError("Supabase key not configured")
-
-    return create_client(settings.supabase_url, key)
+# Background rebuild runs a bit ahead of expiry so request paths never see a stale filter
+BACKGROUND_REFRESH_SECONDS = REFRESH_INTERVAL_SECONDS * 0.9
 
 
 def _load_usernames_into_filter(bf: BloomFilter) -> int:
-    """Load all usernames from database into bloom filter."""
+    """Load all usernames from database into bloom filter. Raises on a database error, so the
+    caller keeps the previous filter instead of swapping in an empty one."""
     try:
         supabase = get_supabase_admin_client()
-        # Fetch all usernames from auth_users_table
-        result = supabase.table("auth_users_table").select("username").execute()
-
-        count = 0
-        for row in result.data:
-            if row.get("username"):
-                bf.add(row["username"].lower())
-                count += 1
-
-        return count
     except ValueError as e:
         # Supabase not configured - this is OK, filter will be empty
         logger.info(f"Supabase not configured, using empty Bloom filter: {e}")
         return 0
-    except Exception as e:
-        # Database error - this is OK, filter will be empty
-        logger.warning(f"Could not load usernames into Bloom filter: {e}")
-        return 0
+
+    # Fetch all usernames from auth_users_table
+    result = supabase.table("auth_users_table").select("username").execute()
+
+    count = 0
+    for row in result.data:
+        if row.get("username"):
+            bf.add(row["username"].lower())
+            count += 1
+
+    return count
 
 
 def get_username_bloom_filter(force_refresh: bool = False) -> BloomFilter:
-    """Get or create the username bloom filter (auto-refreshes)."""
+    """Get or create the username bloom filter (auto-refreshes). A failed refresh keeps the
+    previous filter and its refresh time; raises only if no filter has loaded yet."""
     global _username_bloom_filter, _last_refresh
 
     now = datetime.now(timezone.utc)
@@ -165,23 +142,54 @@ def get_username_bloom_filter(force_refresh: bool = False) -> BloomFilter:
     )
 
     if needs_refresh:
-        _username_bloom_filter = BloomFilter()
-        count = _load_usernames_into_filter(_username_bloom_filter)
+        # Build off to the side and swap in, so concurrent readers never see a half-loaded filter
+        bf = BloomFilter()
+        try:
+            count = _load_usernames_into_filter(bf)
+        except Exception:
+            if _username_bloom_filter is None:
+                raise
+            # Never mark an empty filter fresh: availability checks trust a fresh filter
+            logger.warning("Bloom filter refresh failed, keeping previous filter", exc_info=True)
+            return _username_bloom_filter
+        _username_bloom_filter = bf
         _last_refresh = now
         logger.info(f"Bloom filter refreshed with {count} usernames")
 
     return _username_bloom_filter
 
 
+async def bloom_filter_refresh_loop() -> None:
+    """Rebuild the filter in a worker thread every BACKGROUND_REFRESH_SECONDS.
+    Started by: main.lifespan, after the initial load."""
+    while True:
+        await asyncio.sleep(BACKGROUND_REFRESH_SECONDS)
+        try:
+            await asyncio.to_thread(get_username_bloom_filter, True)
+        except Exception:
+            logger.warning("Background Bloom filter refresh failed", exc_info=True)
+
+
+def get_loaded_bloom_filter() -> Optional[BloomFilter]:
+    """Return the filter only if it is loaded and fresh; never touches the DB, so it is
+    safe to probe on the event loop. Called by: auth username availability checks."""
+    if _username_bloom_filter is None or _last_refresh is None:
+        return None
+    if (datetime.now(timezone.utc) - _last_refresh).total_seconds() > REFRESH_INTERVAL_SECONDS:
+        return None
+    return _username_bloom_filter
+
+
 def add_username_to_filter(username: str):
-    """Add a new username to the bloom filter."""
-    bf = get_username_bloom_filter()
-    bf.add(username.lower())
+    """Add a new username to the in-memory bloom filter. Never triggers a DB reload:
+    a filter that is not loaded yet (or is stale) picks the name up on its next refresh."""
+    if _username_bloom_filter is not None:
+        _username_bloom_filter.add(username.lower())
 
 
 def check_username_availability_fast(username: str) -> Tuple[bool, str]:
     """Bloom filter only check — fast but may have false positives.
-    Called by: auth.generate_username for suggestion validation."""
+    For batches use filter_available_usernames (one filter lookup for all names)."""
     try:
         bf = get_username_bloom_filter()
 
@@ -189,12 +197,20 @@ def check_username_availability_fast(username: str) -> Tuple[bool, str]:
             return False, "Username may be taken"
         else:
             return True, "Username appears available"
-    except Exception as e:
+    except Exception:
         # If Bloom filter fails, assume available (DB will verify)
-        logger.warning(f"Bloom filter fast check failed: {e}")
+        logger.warning("Bloom filter fast check failed", exc_info=True)
         return True, "Username appears available"
 
 
+def filter_available_usernames(usernames: List[str]) -> List[str]:
+    """Batch fast check: fetch the filter once and return the usernames it has definitely
+    not seen, in input order. Called by: auth.generate_username_endpoint."""
+    bf = get_username_bloom_filter()
+    might_contain = bf.might_contain
+    return [u for u in usernames if not might_contain(u.lower())]
+
+
 def check_username_availability_definitive(username: str) -> Tuple[bool, str]:
     """Bloom filter + DB verification — authoritative availability check.
     Called by: auth.signup and auth.check_username."""
@@ -206,9 +222,9 @@ def check_username_availability_definitive(username: str) -> Tuple[bool, str]:
         # Bloom filter: if not in filter, definitely available
         if not bf.might_contain(username_lower):
             return True, "Username is available"
-    except Exception as e:
+    except Exception:
         # Bloom filter failed - skip to DB check or allow
-        logger.warning(f"Bloom filter check failed: {e}")
+        logger.warning("Bloom filter check failed", exc_info=True)
 
     # Bloom filter says might exist (or failed) - try DB verification
     try:
@@ -225,27 +241,62 @@ def check_username_availability_definitive(username: str) -> Tuple[bool, str]:
 
     except ValueError as e:
         # Supabase not configured - allow, actual signup will fail if there's an issue
-        logger.info(f"Supabase not configured (allowing): {e}")
+        logger.info("Supabase not configured (allowing): %s", e)
         return True, "Username appears available"
-    except Exception as e:
+    except Exception:
         # DB check failed - allow signup, let actual insert handle uniqueness
         # This is permissive: Bloom filter said "maybe", but we can't verify
         # Better to allow and let DB constraint catch duplicates
-        logger.warning(f"DB username check failed (allowing): {e}")
+        logger.warning("DB username check failed (allowing)", exc_info=True)
         return True, "Username appears available"
 
 
-def get_bloom_filter_data() -> dict:
-    """Export filter as base64 for client-side checking. Called by: auth.get_bloom_filter_endpoint."""
+# Last exported payload: (filter version, data dict, JSON body, ETag, raw bit array)
+_export_cache: Optional[Tuple[tuple, dict, bytes, str, bytes]] = None
+
+
+def _export_bloom_filter() -> Tuple[tuple, dict, bytes, str, bytes]:
+    """Return the cached export (version, data dict, JSON body, ETag, raw bit array),
+    rebuilding it only when the filter changed since the last export."""
+    global _export_cache
     bf = get_username_bloom_filter()
 
-    return {
-        "filter_data": bf.to_base64(),
-        "hash_count": bf.hash_count,
-        "size": bf.size,
-        "item_count": bf.item_count,
-        "last_updated": bf.last_updated.isoformat()
-    }
+    version = (id(bf), bf.item_count, bf.last_updated)
+    if _export_cache is None or _export_cache[0] != version:
+        raw = bytes(bf.bit_array)
+        data = {
+            "filter_data": base64.b64encode(raw).decode('utf-8'),
+            "hash_count": bf.hash_count,
+            "size": bf.size,
+            "item_count": bf.item_count,
+            "last_updated": bf.last_updated.isoformat()
+        }
+        body = orjson.dumps(data)
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        _export_cache = (version, data, body, etag, raw)
+
+    return _export_cache
+
+
+def get_bloom_filter_payload() -> Tuple[dict, bytes, str]:
+    """Export filter as (data dict, orjson-encoded body, ETag). Base64-encodes and serializes
+    only when the filter changed since the last export. Called by: auth.get_bloom_filter_endpoint."""
+    _, data, body, etag, _ = _export_bloom_filter()
+    return data, body, f'"{etag}"'
+
+
+def get_bloom_filter_raw() -> Tuple[bytes, dict, str]:
+    """Export filter as (raw bit array, metadata, ETag) for clients that accept
+    application/octet-stream — no base64 on either side. Called by: auth.get_bloom_filter_endpoint."""
+    _, data, _, etag, raw = _export_bloom_filter()
+    meta = {key: data[key] for key in ("hash_count", "size", "item_count", "last_updated")}
+    return raw, meta, f'"{etag}-raw"'
+
+
+def get_bloom_filter_data() -> dict:
+    """Export filter as base64 for client-side checking. Called by: batch /auth/bloom-filter."""
+    data, _, _ = get_bloom_filter_payload()
+    return data
 
 
 # Username generation
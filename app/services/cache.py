@@ -1,10 +1,13 @@
-"""In-memory TTL cache for agentic query responses.
-Called by: agents/graph.py (cache lookup before processing, cache store after response)."""
+"""In-memory TTL caches: agentic query responses plus a generic bounded LRU.
+Called by: agents/graph.py (cache lookup before processing, cache store after response),
+dependencies/auth.py (verified token payloads), user_service.py (profile rows)."""
 
 import hashlib
+import threading
 import time
 import logging
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Hashable, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -79,3 +82,59 @@ class ResponseCache:
 
 # Singleton cache instance
 response_cache = ResponseCache()
+
+
+class TTLCache:
+    """Bounded in-memory LRU cache with per-entry expiry (monotonic clock).
+    Safe to share between the event loop and asyncio.to_thread workers."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._store: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired."""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._store[key]
+                return default
+
+            self._store.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value. A per-entry ttl_seconds overrides the cache default."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if ttl <= 0:
+                self._store.pop(key, None)
+                return
+
+            self._store[key] = (time.monotonic() + ttl, value)
+            self._store.move_to_end(key)
+
+            # Evict least recently used entries beyond capacity
+            while len(self._store) > self.max_entries:
+                self._store.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._store.pop(key, None)
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        with self._lock:
+            self._store.clear()
+
+    @property
+    def size(self) -> int:
+        """Current number of cached entries (including not-yet-evicted expired ones)."""
+        return len(self._store)
@@ -4,26 +4,19 @@ chat.py agentic-stream (auto-save after response)."""
 
 import logging
 from typing import Optional, List, Dict, Any
-from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
 def _get_client():
-    """Get Supabase admin client (service role, bypasses RLS)."""
+    """Get the shared Supabase admin client (service role, bypasses RLS), so conversation
+    queries reuse the same keep-alive connection pool as user_service."""
     try:
-        from supabase import create_client
+        from app.services.user_service import get_supabase_admin_client
     except ImportError:
         raise ImportError("supabase package not installed")
 
-    if not settings.supabase_url:
-        raise ValueError("SUPABASE_URL not configured")
-
-    key = settings.supabase_service_role_key or settings.supabase_key
-    if not key:
-        raise ValueError("SUPABASE_SERVICE_ROLE_KEY not configured")
-
-    return create_client(settings.supabase_url, key)
+    return get_supabase_admin_client()
 
 
 async def create_conversation(user_id: str, title: str = "New Conversation") -> Dict[str, Any]:
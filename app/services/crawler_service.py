@@ -6,7 +6,7 @@ import logging
 import re
 import time
 from datetime import timedelta
-from typing import List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
 from urllib.parse import urlparse
 
 import httpx
@@ -20,6 +20,36 @@ from app.api.models.crawler import (
     Citation,
 )
 from app.config.settings import settings
+from app.services.cache import TTLCache
+
+
+# === Shared HTTP Client ===
+
+# One pooled client per process for crawler HTTP calls, so keep-alive connections and TLS
+# sessions are reused across requests. Opened in main.py lifespan, closed on shutdown.
+PROBE_TIMEOUT_SECONDS = 5.0
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared crawler httpx client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=PROBE_TIMEOUT_SECONDS,
+            headers={"User-Agent": settings.crawler_user_agent},
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared crawler client. Called by: main.py lifespan on shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 # === Smart Crawler Selection ===
@@ -49,6 +79,13 @@ JS_HEAVY_DOMAINS = {
 # File extensions that indicate static content
 STATIC_EXTENSIONS = {".html", ".htm", ".txt", ".md", ".xml", ".json", ".pdf"}
 
+# HTML probes and content cleanup, compiled once
+BODY_RE = re.compile(r"<body[^>]*>(.*?)</body>", re.DOTALL | re.IGNORECASE)
+SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+TAG_RE = re.compile(r"<[^>]+>")
+BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
 
 async def detect_crawler_type(url: str) -> CrawlerType:
     """
@@ -73,67 +110,57 @@ async def detect_crawler_type(url: str) -> CrawlerType:
 
     # Probe the URL
     try:
-        async with httpx.AsyncClient(
-            timeout=5.0,
-            headers={"User-Agent": settings.crawler_user_agent},
-            follow_redirects=True,
-        ) as client:
-            response = await client.get(url)
-            content_type = response.headers.get("content-type", "")
-
-            # If not HTML, use BeautifulSoup
-            if "text/html" not in content_type:
-                return CrawlerType.BEAUTIFULSOUP
-
-            html_sample = response.text[:15000]  # First 15KB
-            html_lower = html_sample.lower()
-
-            # Check for SPA framework markers
-            js_markers = [
-                "react", "__react",
-                "angular", "ng-app", "ng-controller",
-                "vue", "v-app", "v-cloak",
-                "__next_data__", "__nuxt__",
-                "window.__initial_state__",
-                "data-reactroot", "data-reactid",
-                "_app", "hydrate",
-            ]
-
-            if any(marker in html_lower for marker in js_markers):
+        response = await get_http_client().get(url)
+        content_type = response.headers.get("content-type", "")
+
+        # If not HTML, use BeautifulSoup
+        if "text/html" not in content_type:
+            return CrawlerType.BEAUTIFULSOUP
+
+        html_sample = response.text[:15000]  # First 15KB
+        html_lower = html_sample.lower()
+
+        # Check for SPA framework markers
+        js_markers = [
+            "react", "__react",
+            "angular", "ng-app", "ng-controller",
+            "vue", "v-app", "v-cloak",
+            "__next_data__", "__nuxt__",
+            "window.__initial_state__",
+            "data-reactroot", "data-reactid",
+            "_app", "hydrate",
+        ]
+
+        if any(marker in html_lower for marker in js_markers):
+            return CrawlerType.PLAYWRIGHT
+
+        # Check if body is mostly empty (common for SPAs)
+        body_match = BODY_RE.search(html_sample)
+        if body_match:
+            body_content = body_match.group(1).strip()
+            # Remove scripts and styles
+            body_text = SCRIPT_RE.sub("", body_content)
+            body_text = STYLE_RE.sub("", body_text)
+            body_text = TAG_RE.sub("", body_text).strip()
+
+            if len(body_text) < 100:  # Mostly empty body = likely SPA
                 return CrawlerType.PLAYWRIGHT
 
-            # Check if body is mostly empty (common for SPAs)
-            body_match = re.search(
-                r"<body[^>]*>(.*?)</body>",
-                html_sample,
-                re.DOTALL | re.IGNORECASE
-            )
-            if body_match:
-                body_content = body_match.group(1).strip()
-                # Remove scripts and styles
-                body_text = re.sub(
-                    r"<script[^>]*>.*?</script>",
-                    "",
-                    body_content,
-                    flags=re.DOTALL | re.IGNORECASE
-                )
-                body_text = re.sub(
-                    r"<style[^>]*>.*?</style>",
-                    "",
-                    body_text,
-                    flags=re.DOTALL | re.IGNORECASE
-                )
-                body_text = re.sub(r"<[^>]+>", "", body_text).strip()
-
-                if len(body_text) < 100:  # Mostly empty body = likely SPA
-                    return CrawlerType.PLAYWRIGHT
-
     except Exception:
         pass  # On error, default to BeautifulSoup
 
     return CrawlerType.BEAUTIFULSOUP
 
 
+def _concurrency_settings(url_count: int):
+    """Start every URL at once, up to settings.crawler_max_concurrent, instead of letting
+    crawlee's autoscaled pool ramp up from its defaults."""
+    from crawlee import ConcurrencySettings
+
+    limit = max(1, min(url_count, settings.crawler_max_concurrent))
+    return ConcurrencySettings(desired_concurrency=limit, max_concurrency=limit)
+
+
 def extract_root_url(url: str) -> str:
     """Extract root domain from URL."""
     parsed = urlparse(url)
@@ -149,17 +176,18 @@ async def crawl_with_beautifulsoup(urls: List[str]) -> List[CrawledPage]:
     # Collect results directly in a list (more reliable than dataset)
     results: List[CrawledPage] = []
 
-    logger.info(f"Creating BeautifulSoup crawler for {len(urls)} URLs")
+    logger.debug("Creating BeautifulSoup crawler for %d URLs", len(urls))
 
     crawler = BeautifulSoupCrawler(
         max_requests_per_crawl=len(urls),
         request_handler_timeout=timedelta(seconds=settings.crawler_timeout),
+        concurrency_settings=_concurrency_settings(len(urls)),
     )
 
     @crawler.router.default_handler
     async def request_handler(context: BeautifulSoupCrawlingContext) -> None:
         start_time = time.time()
-        logger.info(f'Processing {context.request.url} ...')
+        logger.debug("Processing %s ...", context.request.url)
 
         try:
             soup = context.soup
@@ -201,7 +229,7 @@ async def crawl_with_beautifulsoup(urls: List[str]) -> List[CrawledPage]:
                 content = soup.get_text(separator="\n", strip=True)
 
             # Clean up content - remove excessive whitespace
-            content = re.sub(r'\n\s*\n', '\n\n', content)
+            content = BLANK_LINES_RE.sub('\n\n', content)
             content = content[:settings.crawler_max_content_length]
 
             crawl_time = int((time.time() - start_time) * 1000)
@@ -214,15 +242,15 @@ async def crawl_with_beautifulsoup(urls: List[str]) -> List[CrawledPage]:
                 content=content,
                 meta_description=meta_desc,
                 crawl_time_ms=crawl_time,
-                crawler_used=CrawlerType.BEAUTIFULSOUP,
+                crawler_used=CrawlerType.BEAUTIFULSOUP.value,
                 error=None,
             )
             results.append(page)
-            logger.info(f"Successfully crawled {context.request.url}: {len(content)} chars")
+            logger.debug("Successfully crawled %s: %d chars", context.request.url, len(content))
 
         except Exception as e:
             crawl_time = int((time.time() - start_time) * 1000)
-            logger.error(f'Failed to process {context.request.url}: {e}')
+            logger.error("Failed to process %s: %s", context.request.url, e)
 
             # Add error record
             page = CrawledPage(
@@ -232,18 +260,18 @@ async def crawl_with_beautifulsoup(urls: List[str]) -> List[CrawledPage]:
                 content='',
                 meta_description=None,
                 crawl_time_ms=crawl_time,
-                crawler_used=CrawlerType.BEAUTIFULSOUP,
+                crawler_used=CrawlerType.BEAUTIFULSOUP.value,
                 error=str(e),
             )
             results.append(page)
 
     # Run the crawler
-    logger.info(f"Running BeautifulSoup crawler for URLs: {urls}")
+    logger.debug("Running BeautifulSoup crawler for URLs: %s", urls)
     try:
         await crawler.run(urls)
-        logger.info(f"BeautifulSoup crawler completed with {len(results)} results")
+        logger.debug("BeautifulSoup crawler completed with %d results", len(results))
     except Exception as e:
-        logger.error(f"BeautifulSoup crawler.run() failed: {type(e).__name__}: {e}")
+        logger.error("BeautifulSoup crawler.run() failed: %s: %s", type(e).__name__, e)
 
     return results
 
@@ -257,11 +285,12 @@ async def crawl_with_playwright(urls: List[str]) -> List[CrawledPage]:
     # Collect results directly in a list
     results: List[CrawledPage] = []
 
-    logger.info(f"Creating Playwright crawler for {len(urls)} URLs")
+    logger.debug("Creating Playwright crawler for %d URLs", len(urls))
 
     crawler = PlaywrightCrawler(
         max_requests_per_crawl=len(urls),
         request_handler_timeout=timedelta(seconds=settings.crawler_timeout + 15),
+        concurrency_settings=_concurrency_settings(len(urls)),
         browser_type=settings.playwright_browser,
         headless=settings.playwright_headless,
     )
@@ -269,7 +298,7 @@ async def crawl_with_playwright(urls: List[str]) -> List[CrawledPage]:
     @crawler.router.default_handler
     async def request_handler(context: PlaywrightCrawlingContext) -> None:
         start_time = time.time()
-        logger.info(f'Playwright processing {context.request.url} ...')
+        logger.debug("Playwright processing %s ...", context.request.url)
         pw_page = context.page
 
         try:
@@ -316,7 +345,7 @@ async def crawl_with_playwright(urls: List[str]) -> List[CrawledPage]:
             """)
 
             # Clean up content
-            content = re.sub(r'\n\s*\n', '\n\n', content or "")
+            content = BLANK_LINES_RE.sub('\n\n', content or "")
             content = content[:settings.crawler_max_content_length]
 
             crawl_time = int((time.time() - start_time) * 1000)
@@ -329,15 +358,15 @@ async def crawl_with_playwright(urls: List[str]) -> List[CrawledPage]:
                 content=content,
                 meta_description=meta_desc,
                 crawl_time_ms=crawl_time,
-                crawler_used=CrawlerType.PLAYWRIGHT,
+                crawler_used=CrawlerType.PLAYWRIGHT.value,
                 error=None,
             )
             results.append(page)
-            logger.info(f"Playwright successfully crawled {context.request.url}: {len(content)} chars")
+            logger.debug("Playwright successfully crawled %s: %d chars", context.request.url, len(content))
 
         except Exception as e:
             crawl_time = int((time.time() - start_time) * 1000)
-            logger.error(f'Playwright failed to process {context.request.url}: {e}')
+            logger.error("Playwright failed to process %s: %s", context.request.url, e)
 
             # Add error record
             page = CrawledPage(
@@ -347,22 +376,62 @@ async def crawl_with_playwright(urls: List[str]) -> List[CrawledPage]:
                 content='',
                 meta_description=None,
                 crawl_time_ms=crawl_time,
-                crawler_used=CrawlerType.PLAYWRIGHT,
+                crawler_used=CrawlerType.PLAYWRIGHT.value,
                 error=str(e),
             )
             results.append(page)
 
     # Run the crawler
-    logger.info(f"Running Playwright crawler for URLs: {urls}")
+    logger.debug("Running Playwright crawler for URLs: %s", urls)
     try:
         await crawler.run(urls)
-        logger.info(f"Playwright crawler completed with {len(results)} results")
+        logger.debug("Playwright crawler completed with %d results", len(results))
     except Exception as e:
-        logger.error(f"Playwright crawler.run() failed: {type(e).__name__}: {e}")
+        logger.error("Playwright crawler.run() failed: %s: %s", type(e).__name__, e)
 
     return results
 
 
+# === Crawl Result Cache ===
+
+# Recent crawl results keyed by URL set or normalized search query, so follow-up questions about
+# the same sources skip fetching and parsing. Identical concurrent crawls share one task.
+CRAWL_CACHE_TTL_SECONDS = 300
+_crawl_cache = TTLCache(max_entries=256, ttl_seconds=CRAWL_CACHE_TTL_SECONDS)
+_crawls_in_flight: Dict[Hashable, asyncio.Task] = {}
+
+T = TypeVar("T")
+
+
+async def _cached_crawl(
+    key: Hashable,
+    run: Callable[[], Awaitable[T]],
+    succeeded: Callable[[T], bool],
+) -> T:
+    """Return a cached result, join an identical crawl already running, or start one.
+    Results are shared between callers and must be treated as read-only."""
+    cached = _crawl_cache.get(key)
+    if cached is not None:
+        return cached
+
+    task = _crawls_in_flight.get(key)
+    if task is None:
+        async def run_and_store() -> T:
+            try:
+                result = await run()
+                if succeeded(result):  # failed crawls aren't pinned
+                    _crawl_cache.set(key, result)
+                return result
+            finally:
+                _crawls_in_flight.pop(key, None)
+
+        task = asyncio.create_task(run_and_store())
+        _crawls_in_flight[key] = task
+
+    # Shielded: one client disconnecting doesn't cancel the crawl for the others awaiting it
+    return await asyncio.shield(task)
+
+
 # === Main Crawl Function ===
 
 async def crawl_urls(
@@ -370,7 +439,8 @@ async def crawl_urls(
     crawler_type: CrawlerType = CrawlerType.AUTO,
 ) -> CrawlResult:
     """
-    Crawl a list of URLs with smart crawler selection.
+    Crawl a list of URLs with smart crawler selection. Results are cached per URL set and
+    crawler type for CRAWL_CACHE_TTL_SECONDS.
 
     Args:
         urls: List of URLs to crawl
@@ -379,7 +449,16 @@ async def crawl_urls(
     Returns:
         CrawlResult with crawled pages
     """
-    logger.info(f"crawl_urls called with {len(urls)} URLs, crawler_type={crawler_type}")
+    return await _cached_crawl(
+        ("crawl", tuple(sorted(urls)), crawler_type),
+        lambda: _crawl_urls(urls, crawler_type),
+        lambda result: result.successful_pages > 0,
+    )
+
+
+async def _crawl_urls(urls: List[str], crawler_type: CrawlerType) -> CrawlResult:
+    """Uncached crawl_urls."""
+    logger.debug("crawl_urls called with %d URLs, crawler_type=%s", len(urls), crawler_type)
     start_time = time.time()
     all_pages: List[CrawledPage] = []
 
@@ -389,9 +468,14 @@ async def crawl_urls(
             bs_urls: List[str] = []
             pw_urls: List[str] = []
 
-            logger.info("Detecting crawler types for each URL...")
-            detection_tasks = [detect_crawler_type(url) for url in urls]
-            detected_types = await asyncio.gather(*detection_tasks)
+            logger.debug("Detecting crawler types for each URL...")
+            probe_slots = asyncio.Semaphore(settings.crawler_max_concurrent)
+
+            async def detect(url: str) -> CrawlerType:
+                async with probe_slots:
+                    return await detect_crawler_type(url)
+
+            detected_types = await asyncio.gather(*(detect(url) for url in urls))
 
             for url, detected in zip(urls, detected_types):
                 if detected == CrawlerType.PLAYWRIGHT:
@@ -399,15 +483,15 @@ async def crawl_urls(
                 else:
                     bs_urls.append(url)
 
-            logger.info(f"URL distribution: {len(bs_urls)} BeautifulSoup, {len(pw_urls)} Playwright")
+            logger.debug("URL distribution: %d BeautifulSoup, %d Playwright", len(bs_urls), len(pw_urls))
 
             # Crawl in parallel
             tasks = []
             if bs_urls:
-                logger.info(f"Starting BeautifulSoup crawl for {len(bs_urls)} URLs")
+                logger.debug("Starting BeautifulSoup crawl for %d URLs", len(bs_urls))
                 tasks.append(crawl_with_beautifulsoup(bs_urls))
             if pw_urls:
-                logger.info(f"Starting Playwright crawl for {len(pw_urls)} URLs")
+                logger.debug("Starting Playwright crawl for %d URLs", len(pw_urls))
                 tasks.append(crawl_with_playwright(pw_urls))
 
             if tasks:
@@ -415,19 +499,20 @@ async def crawl_urls(
 
                 for i, result in enumerate(results):
                     if isinstance(result, Exception):
-                        logger.error(f"Crawler task {i} failed: {type(result).__name__}: {result}")
-                        import traceback
-                        logger.error(traceback.format_exc())
+                        logger.error(
+                            "Crawler task %d failed: %s: %s", i, type(result).__name__, result,
+                            exc_info=result,
+                        )
                     else:
-                        logger.info(f"Crawler task {i} returned {len(result)} pages")
+                        logger.debug("Crawler task %d returned %d pages", i, len(result))
                         all_pages.extend(result)
 
         elif crawler_type == CrawlerType.BEAUTIFULSOUP:
-            logger.info(f"Using BeautifulSoup crawler for all {len(urls)} URLs")
+            logger.debug("Using BeautifulSoup crawler for all %d URLs", len(urls))
             all_pages = await crawl_with_beautifulsoup(urls)
 
         elif crawler_type == CrawlerType.PLAYWRIGHT:
-            logger.info(f"Using Playwright crawler for all {len(urls)} URLs")
+            logger.debug("Using Playwright crawler for all %d URLs", len(urls))
             all_pages = await crawl_with_playwright(urls)
 
         total_time = int((time.time() - start_time) * 1000)
@@ -436,16 +521,18 @@ async def crawl_urls(
         successful = sum(1 for p in all_pages if not p.error and p.content)
         failed = len(urls) - successful
 
-        logger.info(f"crawl_urls completed: {successful} successful, {failed} failed, {total_time}ms total")
+        logger.info("crawl_urls completed: %d successful, %d failed, %dms total", successful, failed, total_time)
 
-        # Log each page result
-        for page in all_pages:
-            if page.error:
-                logger.warning(f"  Page {page.url}: ERROR - {page.error}")
-            else:
-                logger.info(f"  Page {page.url}: OK - {len(page.content)} chars, title='{page.title}'")
+        # Log each page result (debug only; the summary above covers normal operation)
+        if logger.isEnabledFor(logging.DEBUG):
+            for page in all_pages:
+                if page.error:
+                    logger.debug("  Page %s: ERROR - %s", page.url, page.error)
+                else:
+                    logger.debug("  Page %s: OK - %d chars, title='%s'", page.url, len(page.content), page.title)
 
-        return CrawlResult(
+        # Pages were validated when crawled, skip re-validating each one
+        return CrawlResult.model_construct(
             pages=all_pages,
             total_pages=len(urls),
             successful_pages=successful,
@@ -454,9 +541,7 @@ async def crawl_urls(
         )
 
     except Exception as e:
-        logger.error(f"crawl_urls failed with exception: {type(e).__name__}: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("crawl_urls failed with exception: %s: %s", type(e).__name__, e)
         return CrawlResult(
             pages=[],
             total_pages=len(urls),
@@ -476,12 +561,10 @@ def _sync_duckduckgo_search(query: str, max_results: int) -> List[str]:
         with DDGS() as ddgs:
             results = list(ddgs.text(query, max_results=max_results))
             urls = [r["href"] for r in results if r.get("href")]
-            logger.info(f"DuckDuckGo returned {len(urls)} URLs for query: {query}")
+            logger.debug("DuckDuckGo returned %d URLs for query: %s", len(urls), query)
             return urls
     except Exception as e:
-        logger.error(f"DuckDuckGo search failed: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("DuckDuckGo search failed: %s", e)
         return []
 
 
@@ -503,15 +586,19 @@ def _sync_duckduckgo_search_full(query: str, max_results: int) -> List[dict]:
                         "title": r.get("title", ""),
                         "snippet": r.get("body", ""),
                     })
-            logger.info(f"DuckDuckGo returned {len(search_results)} full results for query: {query}")
+            logger.debug("DuckDuckGo returned %d full results for query: %s", len(search_results), query)
             return search_results
     except Exception as e:
-        logger.error(f"DuckDuckGo search failed: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("DuckDuckGo search failed: %s", e)
         return []
 
 
+# Recent agentic_search results keyed by (normalized query, max_results, engine); retries and
+# repeated questions skip the search round-trip
+SEARCH_CACHE_TTL_SECONDS = 60
+_search_cache = TTLCache(max_entries=512, ttl_seconds=SEARCH_CACHE_TTL_SECONDS)
+
+
 async def agentic_search(
     query: str,
     max_results: int = 25,
@@ -528,20 +615,18 @@ async def agentic_search(
     Returns:
         List of search results with url, title, snippet
     """
-    import concurrent.futures
+    if search_engine != "duckduckgo":
+        raise ValueError(f"Search engine '{search_engine}' not implemented")
 
-    if search_engine == "duckduckgo":
-        loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            results = await loop.run_in_executor(
-                pool,
-                _sync_duckduckgo_search_full,
-                query,
-                max_results
-            )
-            return results
+    cache_key = (" ".join(query.lower().split()), max_results, search_engine)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
 
-    raise ValueError(f"Search engine '{search_engine}' not implemented")
+    results = await asyncio.to_thread(_sync_duckduckgo_search_full, query, max_results)
+    if results:  # an empty list is how a failed search reports, so don't pin it
+        _search_cache.set(cache_key, results)
+    return list(results)
 
 
 async def search_web(
@@ -584,19 +669,34 @@ async def search_and_crawl(
     search_engine: str = "duckduckgo",
 ) -> Tuple[CrawlResult, List[str]]:
     """
-    Search web for query and crawl top results.
+    Search web for query and crawl top results. Results are cached per normalized query and
+    options for CRAWL_CACHE_TTL_SECONDS.
 
     Returns:
         Tuple of (CrawlResult, search_urls)
     """
-    logger.info(f"Starting search_and_crawl for query: '{query}'")
+    return await _cached_crawl(
+        ("search", " ".join(query.lower().split()), max_results, crawler_type, search_engine),
+        lambda: _search_and_crawl(query, max_results, crawler_type, search_engine),
+        lambda result: result[0].successful_pages > 0,
+    )
+
+
+async def _search_and_crawl(
+    query: str,
+    max_results: int,
+    crawler_type: CrawlerType,
+    search_engine: str,
+) -> Tuple[CrawlResult, List[str]]:
+    """Uncached search_and_crawl."""
+    logger.debug("Starting search_and_crawl for query: '%s'", query)
 
     try:
         urls = await search_web(query, max_results, search_engine)
-        logger.info(f"Search returned {len(urls)} URLs: {urls}")
+        logger.debug("Search returned %d URLs: %s", len(urls), urls)
 
         if not urls:
-            logger.warning(f"No URLs found for query: '{query}'")
+            logger.warning("No URLs found for query: '%s'", query)
             return CrawlResult(
                 pages=[],
                 total_pages=0,
@@ -605,14 +705,14 @@ async def search_and_crawl(
                 total_crawl_time_ms=0,
             ), []
 
-        logger.info(f"Starting crawl of {len(urls)} URLs with crawler_type={crawler_type}")
+        logger.debug("Starting crawl of %d URLs with crawler_type=%s", len(urls), crawler_type)
         result = await crawl_urls(urls, crawler_type)
-        logger.info(f"Crawl completed: {result.successful_pages}/{result.total_pages} successful")
+        logger.debug("Crawl completed: %d/%d successful", result.successful_pages, result.total_pages)
 
         return result, urls
 
     except Exception as e:
-        logger.error(f"search_and_crawl failed: {type(e).__name__}: {e}")
+        logger.error("search_and_crawl failed: %s: %s", type(e).__name__, e)
         return CrawlResult(
             pages=[],
             total_pages=0,
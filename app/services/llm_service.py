@@ -1,8 +1,9 @@
 """LLM service — multi-provider LangChain wrapper (Gemini, OpenAI, Anthropic).
 Called by: chat.py (completions/stream), crawler.py (web chat), agents/graph.py (agentic nodes)."""
 
-from typing import Optional, AsyncGenerator, Literal
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+from functools import lru_cache
+from typing import Any, Optional, AsyncGenerator, Literal, Sequence
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.output_parsers import StrOutputParser
 from app.config.settings import settings
@@ -61,38 +62,84 @@ def get_llm(provider: Optional[LLMProvider] = None, streaming: bool = False, mod
         raise ValueError(f"Unsupported provider: {provider}")
 
 
-def get_chat_chain(provider: Optional[LLMProvider] = None, system_prompt: Optional[str] = None):
+DEFAULT_SYSTEM_PROMPT = """You are Nurav AI, a helpful and intelligent assistant.
+You provide clear, accurate, and well-formatted responses.
+When providing code, use proper markdown code blocks with language specification.
+Be concise but thorough in your explanations."""
+
+# Chat prompt compiled once. The system prompt is a template variable, so grounded prompts
+# (tens of KB of web sources) are not parsed as templates per request and braces in them stay literal.
+CHAT_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "{system_prompt}"),
+    MessagesPlaceholder(variable_name="chat_history", optional=True),
+    ("human", "{input}"),
+])
+
+
+def get_chat_chain(provider: Optional[LLMProvider] = None, streaming: bool = False):
     """
-    Create a chat chain with optional system prompt.
+    Create a chat chain. Invoke with system_prompt, chat_history and input.
 
     Args:
         provider: LLM provider
-        system_prompt: Optional system prompt for the assistant
+        streaming: Whether the LLM streams tokens
 
     Returns:
         LangChain runnable chain
     """
-    llm = get_llm(provider)
+    return CHAT_PROMPT | get_llm(provider, streaming=streaming) | StrOutputParser()
 
-    default_system = """You are Nurav AI, a helpful and intelligent assistant.
-You provide clear, accurate, and well-formatted responses.
-When providing code, use proper markdown code blocks with language specification.
-Be concise but thorough in your explanations."""
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", system_prompt or default_system),
-        MessagesPlaceholder(variable_name="chat_history", optional=True),
-        ("human", "{input}"),
-    ])
+# Section markers wrapped around retrieved context in grounded system prompts
+SEARCH_RESULTS_MARKERS = ("\n\n--- SEARCH RESULTS ---\n", "\n--- END SEARCH RESULTS ---")
+WEB_SOURCES_MARKERS = ("\n\n--- WEB SOURCES ---\n", "\n--- END SOURCES ---")
+
+
+@lru_cache(maxsize=256)
+def _system_prompt_prefix(base_prompt: str, custom_prompt: Optional[str], header: str) -> str:
+    """Base prompt + optional custom instructions + context header, built once per distinct
+    custom prompt (clients resend the same one with every message)."""
+    if custom_prompt:
+        return "".join((base_prompt, "\n\nAdditional instructions: ", custom_prompt, header))
+    return base_prompt + header
+
 
-    chain = prompt | llm | StrOutputParser()
-    return chain
+def build_grounded_system_prompt(
+    base_prompt: str,
+    context: str,
+    custom_prompt: Optional[str] = None,
+    markers: tuple = WEB_SOURCES_MARKERS,
+) -> str:
+    """Wrap retrieved context in the given base prompt and section markers, appending the
+    user's custom instructions. Called by: chat.py and crawler.py web-augmented routes."""
+    header, footer = markers
+    return "".join((_system_prompt_prefix(base_prompt, custom_prompt, header), context, footer))
+
+
+def to_langchain_history(chat_history: Optional[Sequence[Any]]) -> list:
+    """Convert chat history to LangChain messages. Accepts validated ChatMessage models
+    (read by attribute, no intermediate dicts), plain role/content dicts, or already-converted
+    LangChain messages (passed through, so routes can convert ahead of time)."""
+    history = []
+    for msg in chat_history or ():
+        if isinstance(msg, BaseMessage):
+            history.append(msg)
+            continue
+        if isinstance(msg, dict):
+            role, content = msg.get("role"), msg.get("content", "")
+        else:
+            role, content = msg.role, msg.content
+        if role == "user":
+            history.append(HumanMessage(content=content))
+        elif role == "assistant":
+            history.append(AIMessage(content=content))
+    return history
 
 
 async def chat(
     message: str,
     provider: Optional[LLMProvider] = None,
-    chat_history: Optional[list] = None,
+    chat_history: Optional[Sequence[Any]] = None,
     system_prompt: Optional[str] = None,
 ) -> str:
     """
@@ -101,24 +148,19 @@ async def chat(
     Args:
         message: User message
         provider: LLM provider (google, openai, anthropic)
-        chat_history: Optional list of previous messages
+        chat_history: Optional previous messages (see to_langchain_history)
         system_prompt: Optional system prompt
 
     Returns:
         AI response as string
     """
-    chain = get_chat_chain(provider, system_prompt)
+    chain = get_chat_chain(provider)
 
     # Convert chat history to LangChain message format
-    history = []
-    if chat_history:
-        for msg in chat_history:
-            if msg.get("role") == "user":
-                history.append(HumanMessage(content=msg.get("content", "")))
-            elif msg.get("role") == "assistant":
-                history.append(AIMessage(content=msg.get("content", "")))
+    history = to_langchain_history(chat_history)
 
     response = await chain.ainvoke({
+        "system_prompt": system_prompt or DEFAULT_SYSTEM_PROMPT,
         "input": message,
         "chat_history": history,
     })
@@ -129,7 +171,7 @@ async def chat(
 async def chat_stream(
     message: str,
     provider: Optional[LLMProvider] = None,
-    chat_history: Optional[list] = None,
+    chat_history: Optional[Sequence[Any]] = None,
     system_prompt: Optional[str] = None,
 ) -> AsyncGenerator[str, None]:
     """
@@ -138,37 +180,19 @@ async def chat_stream(
     Args:
         message: User message
         provider: LLM provider
-        chat_history: Optional list of previous messages
+        chat_history: Optional previous messages (see to_langchain_history)
         system_prompt: Optional system prompt
 
     Yields:
         Response chunks as strings
     """
-    llm = get_llm(provider, streaming=True)
-
-    default_system = """You are Nurav AI, a helpful and intelligent assistant.
-You provide clear, accurate, and well-formatted responses.
-When providing code, use proper markdown code blocks with language specification.
-Be concise but thorough in your explanations."""
-
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", system_prompt or default_system),
-        MessagesPlaceholder(variable_name="chat_history", optional=True),
-        ("human", "{input}"),
-    ])
-
-    chain = prompt | llm | StrOutputParser()
+    chain = get_chat_chain(provider, streaming=True)
 
     # Convert chat history
-    history = []
-    if chat_history:
-        for msg in chat_history:
-            if msg.get("role") == "user":
-                history.append(HumanMessage(content=msg.get("content", "")))
-            elif msg.get("role") == "assistant":
-                history.append(AIMessage(content=msg.get("content", "")))
+    history = to_langchain_history(chat_history)
 
     async for chunk in chain.astream({
+        "system_prompt": system_prompt or DEFAULT_SYSTEM_PROMPT,
         "input": message,
         "chat_history": history,
     }):
@@ -29,6 +29,20 @@ REQUIRE_DIGIT = True
 REQUIRE_SPECIAL = True
 SPECIAL_CHARS = "!@#$%^&*()_+-=[]{}|;':\",./<>?"
 
+# Character-class and weak-pattern checks, compiled once at import
+UPPERCASE_RE = re.compile(r'[A-Z]')
+LOWERCASE_RE = re.compile(r'[a-z]')
+DIGIT_RE = re.compile(r'\d')
+SPECIAL_RE = re.compile(r'[!@#$%^&*()_+\-=\[\]{}|;\':",./<>?]')
+REPEATED_RE = re.compile(r'(.)\1{2,}')  # 3+ repeated characters
+SEQUENTIAL_DIGITS_RE = re.compile(r'(012|123|234|345|456|567|678|789)')
+# Any weak pattern: repeats, sequential numbers, sequential letters (matched on lowercased input)
+COMMON_PATTERN_RE = re.compile(
+    r'(.)\1{2,}'
+    r'|(012|123|234|345|456|567|678|789|890)'
+    r'|(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)'
+)
+
 
 def validate_password(password: str) -> Tuple[bool, str, list]:
     """Check password meets complexity requirements (8+ chars, mixed case, digit, special).
@@ -44,29 +58,21 @@ def validate_password(password: str) -> Tuple[bool, str, list]:
     if len(password) > MAX_LENGTH:
         issues.append(f"Maximum {MAX_LENGTH} characters")
 
-    if REQUIRE_UPPERCASE and not re.search(r'[A-Z]', password):
+    if REQUIRE_UPPERCASE and not UPPERCASE_RE.search(password):
         issues.append("One uppercase letter")
 
-    if REQUIRE_LOWERCASE and not re.search(r'[a-z]', password):
+    if REQUIRE_LOWERCASE and not LOWERCASE_RE.search(password):
         issues.append("One lowercase letter")
 
-    if REQUIRE_DIGIT and not re.search(r'\d', password):
+    if REQUIRE_DIGIT and not DIGIT_RE.search(password):
         issues.append("One number")
 
-    if REQUIRE_SPECIAL and not re.search(r'[!@#$%^&*()_+\-=\[\]{}|;\':",./<>?]', password):
+    if REQUIRE_SPECIAL and not SPECIAL_RE.search(password):
         issues.append("One special character (!@#$%^&*...)")
 
     # Check for common patterns
-    common_patterns = [
-        r'(.)\1{2,}',  # 3+ repeated characters
-        r'(012|123|234|345|456|567|678|789|890)',  # Sequential numbers
-        r'(abc|bcd|cde|def|efg|fgh|ghi|hij|ijk|jkl|klm|lmn|mno|nop|opq|pqr|qrs|rst|stu|tuv|uvw|vwx|wxy|xyz)',  # Sequential letters
-    ]
-
-    for pattern in common_patterns:
-        if re.search(pattern, password.lower()):
-            issues.append("No sequential or repeated patterns")
-            break
+    if COMMON_PATTERN_RE.search(password.lower()):
+        issues.append("No sequential or repeated patterns")
 
     if issues:
         return False, f"Password must have: {', '.join(issues)}", issues
@@ -89,34 +95,27 @@ def calculate_password_strength(password: str) -> dict:
     if length >= 16:
         score += 10
 
-    # Character variety (up to 40 points)
-    if re.search(r'[a-z]', password):
-        score += 10
-    if re.search(r'[A-Z]', password):
-        score += 10
-    if re.search(r'\d', password):
-        score += 10
-    if re.search(r'[!@#$%^&*()_+\-=\[\]{}|;\':",./<>?]', password):
-        score += 10
-
-    # Bonus for mixing (up to 20 points)
+    # Character variety (up to 40 points), each class scanned once
     char_types = sum([
-        bool(re.search(r'[a-z]', password)),
-        bool(re.search(r'[A-Z]', password)),
-        bool(re.search(r'\d', password)),
-        bool(re.search(r'[!@#$%^&*()_+\-=\[\]{}|;\':",./<>?]', password)),
+        bool(LOWERCASE_RE.search(password)),
+        bool(UPPERCASE_RE.search(password)),
+        bool(DIGIT_RE.search(password)),
+        bool(SPECIAL_RE.search(password)),
     ])
+    score += 10 * char_types
+
+    # Bonus for mixing (up to 20 points)
     if char_types >= 3:
         score += 10
     if char_types == 4:
         score += 10
 
     # Penalties
-    if re.search(r'(.)\1{2,}', password):
+    if REPEATED_RE.search(password):
         score -= 10
         feedback.append("Avoid repeated characters")
 
-    if re.search(r'(012|123|234|345|456|567|678|789)', password):
+    if SEQUENTIAL_DIGITS_RE.search(password):
         score -= 10
         feedback.append("Avoid sequential numbers")
 
@@ -3,8 +3,10 @@ Called by: auth routes (signup/signin/signout lifecycle), chat routes (get user
 import logging
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, Tuple
 from app.config.settings import settings
+from app.services.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +19,12 @@ except ImportError:
 # Username regex: starts with letter, 6-18 chars, only letters, numbers, _, -, .
 USERNAME_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9_.\-]{5,17}$')
 
+# auth_users_table rows keyed by user_uuid; /me and /profile hit this on every page load
+PROFILE_CACHE_TTL_SECONDS = 60
+_profile_cache = TTLCache(max_entries=10000, ttl_seconds=PROFILE_CACHE_TTL_SECONDS)
 
+
+@lru_cache(maxsize=1)
 def get_supabase_client():
     """Get Supabase client with anon key (for auth operations)."""
     if not settings.supabase_url or not settings.supabase_key:
@@ -25,8 +32,10 @@ def get_supabase_client():
     return create_client(settings.supabase_url, settings.supabase_key)
 
 
+@lru_cache(maxsize=1)
 def get_supabase_admin_client():
-    """Get Supabase client with service role key (bypasses RLS)."""
+    """Get Supabase client with service role key (bypasses RLS). One per process,
+    shared by bloom_filter_service and conversation_service so they reuse its connection pool."""
     if not settings.supabase_url:
         raise ValueError("SUPABASE_URL not configured")
 
@@ -37,8 +46,10 @@ def get_supabase_admin_client():
     return create_client(settings.supabase_url, key)
 
 
+@lru_cache(maxsize=8192)
 def validate_username(username: str) -> Tuple[bool, str]:
     """Validate username format (6-18 chars, starts with letter, allows _ - .).
+    Pure, so results are memoised for repeat checks of the same name.
     Called by: auth.signup, auth.check_username."""
     if not username:
         return False, "Username is required"
@@ -108,6 +119,7 @@ def sync_user_signin(user_uuid: str) -> dict:
             "last_login_at": now,
             "updated_at": now,
         }).eq("user_uuid", user_uuid).execute()
+        invalidate_user_cache(user_uuid)
         return result.data[0] if result.data else {}
     except Exception as e:
         logger.warning(f"Signin sync error: {e}")
@@ -123,6 +135,7 @@ def sync_user_signout(user_uuid: str) -> dict:
         result = supabase.table("auth_users_table").update({
             "updated_at": now,
         }).eq("user_uuid", user_uuid).execute()
+        invalidate_user_cache(user_uuid)
         return result.data[0] if result.data else {}
     except Exception as e:
         logger.warning(f"Signout sync error: {e}")
@@ -137,20 +150,41 @@ def check_username_exists(username: str) -> bool:
             "username", username.lower()
         ).execute()
         return len(result.data) > 0
-    except Exception as e:
-        logger.warning(f"Username check error: {e}")
+    except Exception:
+        logger.warning("Username check error", exc_info=True)
         return False
 
 
 def get_user_by_uuid(user_uuid: str) -> Optional[dict]:
-    """Fetch full user row from auth_users_table by UUID.
+    """Fetch full user row from auth_users_table by UUID (cached for PROFILE_CACHE_TTL_SECONDS).
     Called by: auth.get_current_user_info, auth.signin, auth.get_user_profile."""
+    cached = _profile_cache.get(user_uuid)
+    if cached is not None:
+        return cached
+
     supabase = get_supabase_admin_client()
     try:
         result = supabase.table("auth_users_table").select("*").eq(
             "user_uuid", user_uuid
         ).execute()
-        return result.data[0] if result.data else None
     except Exception as e:
         logger.warning(f"Get user error: {e}")
         return None
+
+    if not result.data:
+        return None
+    profile = result.data[0]
+    _profile_cache.set(user_uuid, profile)
+    return profile
+
+
+def get_cached_user(user_uuid: str) -> Optional[dict]:
+    """Return a cached profile row without touching the DB (safe to call on the event loop).
+    Called by: auth.get_current_user_info, auth.get_user_profile."""
+    return _profile_cache.get(user_uuid)
+
+
+def invalidate_user_cache(user_uuid: str) -> None:
+    """Drop a cached profile row after it changes.
+    Called by: sync_user_signin, sync_user_signout, auth.update_user_profile."""
+    _profile_cache.pop(user_uuid)
@@ -8,15 +8,16 @@ import logging
 import io
 
 import httpx
-import pandas as pd
 from langchain_core.tools import tool
 from app.tools.base import nurav_tool, ToolMetadata, ToolStatus, ToolExample
 
 logger = logging.getLogger(__name__)
 
 
-async def _load_data(file_url: str) -> pd.DataFrame:
+async def _load_data(file_url: str):
     """Download and load CSV/Excel file into a DataFrame."""
+    import pandas as pd
+
     async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
         resp = await client.get(file_url)
         resp.raise_for_status()
@@ -35,7 +36,7 @@ async def _load_data(file_url: str) -> pd.DataFrame:
             return pd.read_csv(io.BytesIO(data), sep=None, engine="python")
 
 
-def _generate_summary(df: pd.DataFrame) -> dict:
+def _generate_summary(df) -> dict:
     """Generate a summary of the DataFrame."""
     return {
         "rows": len(df),
@@ -47,7 +48,7 @@ def _generate_summary(df: pd.DataFrame) -> dict:
     }
 
 
-def _generate_stats(df: pd.DataFrame) -> dict:
+def _generate_stats(df) -> dict:
     """Generate statistics for numeric columns."""
     numeric_df = df.select_dtypes(include=["number"])
     if numeric_df.empty:
@@ -70,7 +71,7 @@ def _generate_stats(df: pd.DataFrame) -> dict:
     return stats
 
 
-def _generate_profile(df: pd.DataFrame) -> dict:
+def _generate_profile(df) -> dict:
     """Generate a data quality profile."""
     total_cells = df.shape[0] * df.shape[1]
     missing_cells = int(df.isnull().sum().sum())
@@ -4,6 +4,7 @@ import importlib
 import inspect
 import logging
 import pkgutil
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable
 
@@ -43,9 +44,12 @@ class ToolRegistry:
             for module_file in module_files:
                 module_name = f"{TOOLS_PACKAGE}.{niche_name}.{module_file.stem}"
                 try:
-                    module = importlib.import_module(module_name)
-                    # Reload if already imported (for hot reload)
-                    module = importlib.reload(module)
+                    if module_name in sys.modules:
+                        # Re-scan: reload so edited tools are picked up (hot reload)
+                        module = importlib.reload(sys.modules[module_name])
+                    else:
+                        # First scan: a plain import, not import + reload (which ran every module twice)
+                        module = importlib.import_module(module_name)
 
                     for attr_name in dir(module):
                         obj = getattr(module, attr_name)
@@ -1,8 +1,10 @@
+import contextlib
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import uvicorn
 import os
 from app.api.routes.auth import router as auth_router
@@ -10,7 +12,10 @@ from app.api.routes.chat import router as chat_router
 from app.api.routes.crawler import router as crawler_router
 from app.api.routes.conversations import router as conversations_router
 from app.api.routes.tools import router as tools_router
+from app.api.routes.batch import router as batch_router
 from app.tools.registry import tool_registry
+from app.services.bloom_filter_service import get_username_bloom_filter, bloom_filter_refresh_loop
+from app.services.crawler_service import get_http_client, close_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +25,25 @@ async def lifespan(app: FastAPI):
     # Startup: scan and register all tools
     tool_registry.scan()
     logger.info(f"Tool registry ready: {tool_registry.count} tools registered")
+
+    # Load the username Bloom filter before serving, then keep it fresh in the background
+    try:
+        await asyncio.to_thread(get_username_bloom_filter, True)
+    except Exception:
+        # Checks fall back to the DB until the background loop loads it
+        logger.warning("Initial Bloom filter load failed", exc_info=True)
+    bloom_refresher = asyncio.create_task(bloom_filter_refresh_loop())
+
+    # Open the pooled crawler HTTP client up front rather than on the first chat request
+    get_http_client()
+
     yield
-    # Shutdown: cleanup if needed
+
+    # Shutdown
+    bloom_refresher.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await bloom_refresher
+    await close_http_client()
 
 
 app = FastAPI(
@@ -29,6 +51,7 @@ app = FastAPI(
     description="A FastAPI backend service",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS Configuration - Allow frontend origins
@@ -71,7 +94,7 @@ app.add_middleware(
 @app.options("/{rest_of_path:path}")
 async def preflight_handler(request: Request, rest_of_path: str):
     """Handle preflight OPTIONS requests explicitly for CORS."""
-    return JSONResponse(
+    return ORJSONResponse(
         content={"message": "OK"},
         headers={
             "Access-Control-Allow-Origin": request.headers.get("origin", "*"),
@@ -87,13 +110,14 @@ app.include_router(chat_router)
 app.include_router(crawler_router)
 app.include_router(conversations_router)
 app.include_router(tools_router)
+app.include_router(batch_router)
 
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Backend Architect API is running!", "status": "healthy"}
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "healthy", "service": "backend-architect"}
 
 if __name__ == "__main__":
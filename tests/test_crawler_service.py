@@ -0,0 +1,83 @@
+"""
+Tests for crawler_service page building, with crawlee replaced by an in-process fake crawler.
+"""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+BeautifulSoup = pytest.importorskip("bs4").BeautifulSoup
+
+from app.services import crawler_service  # noqa: E402
+
+
+HTML = """
+<html>
+  <head>
+    <title> Example Page </title>
+    <meta name="description" content="An example page">
+  </head>
+  <body><nav>Menu</nav><main><p>Hello</p><p>World</p></main></body>
+</html>
+"""
+
+
+class _FakeRouter:
+    def __init__(self):
+        self.handler = None
+
+    def default_handler(self, fn):
+        self.handler = fn
+        return fn
+
+
+class _FakeBeautifulSoupCrawler:
+    """Runs the registered handler once per URL with a parsed HTML context."""
+
+    def __init__(self, **kwargs):
+        self.router = _FakeRouter()
+
+    async def run(self, urls):
+        for url in urls:
+            context = types.SimpleNamespace(
+                request=types.SimpleNamespace(url=url),
+                soup=BeautifulSoup(HTML, "html.parser"),
+            )
+            await self.router.handler(context)
+
+
+@pytest.fixture
+def fake_crawlee(monkeypatch):
+    crawlee = types.ModuleType("crawlee")
+    crawlee.ConcurrencySettings = lambda **kwargs: kwargs
+    crawlers = types.ModuleType("crawlee.crawlers")
+    crawlers.BeautifulSoupCrawler = _FakeBeautifulSoupCrawler
+    crawlers.BeautifulSoupCrawlingContext = types.SimpleNamespace
+    crawlee.crawlers = crawlers
+    monkeypatch.setitem(sys.modules, "crawlee", crawlee)
+    monkeypatch.setitem(sys.modules, "crawlee.crawlers", crawlers)
+
+
+def test_crawl_with_beautifulsoup_builds_pages(fake_crawlee):
+    pages = asyncio.run(crawler_service.crawl_with_beautifulsoup(["https://example.com/a"]))
+
+    assert len(pages) == 1
+    page = pages[0]
+    assert page.error is None
+    assert page.crawler_used == "beautifulsoup"
+    assert page.url == "https://example.com/a"
+    assert page.root_url == "https://example.com"
+    assert page.title == "Example Page"
+    assert page.meta_description == "An example page"
+    assert page.content == "Hello\nWorld"
+
+
+def test_crawled_page_citation_keeps_crawler_type(fake_crawlee):
+    pages = asyncio.run(crawler_service.crawl_with_beautifulsoup(["https://example.com/a"]))
+
+    citations = crawler_service.generate_citations(pages)
+
+    assert [c.crawler_type for c in citations] == ["beautifulsoup"]